@@ -1,9 +1,21 @@
 # cpu_scheduler_modern_final.py
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-import random, itertools
+import random, time
+from scheduler_core import aggregate_stats, ALGORITHM_LABELS, _compute_stats_from_gantt
+import scheduler_io
+from scheduler_worker import SimulationSession
+from scheduler_cache import ResultCache, cache_key, workload_fingerprint
+from gantt_render import GanttView, PlaybackCursor, pid_color, text_contrast
+
+LEGEND_MAX = 40
+FRAME_MS = 33            # playback redraw interval (~30 fps)
+PLAY_STEP_S = 0.7        # 1x speed: one segment per 700 ms
+PLAY_SPEEDS = ["0.5x","1x","2x","5x","10x","100x","1000x","10000x"]
+POLL_MS = 50             # background job polling interval
+RESULT_CACHE = ResultCache(maxsize=16)   # reruns of an unchanged workload are instant
 
 # optional mplcursors
 try:
@@ -12,203 +24,75 @@ try:
 except Exception:
     _HAS_MPLCURSORS = False
 
-# ---------------- helper visuals ----------------
-def pid_color(pid):
-    h = abs(hash(pid)) % (16**6)
-    return "#{:06X}".format(h)
-
-def text_contrast(hex_color):
-    hex_color = hex_color.lstrip("#")
-    r, g, b = int(hex_color[0:2],16), int(hex_color[2:4],16), int(hex_color[4:6],16)
-    lum = 0.2126*r + 0.7152*g + 0.0722*b
-    return "black" if lum > 150 else "white"
-
-# ---------------- compute stats ----------------
-def _compute_stats_from_gantt(gantt, processes):
+# ---------------- widgets ----------------
+class VirtualTable:
     """
-    [pid, arrival, burst, priority, completion, TAT, WT, RT]
+    Treeview that only holds as many items as it shows. Rows stay in a Python
+    sequence (set_rows is O(1)); scrolling rewrites the visible items' values,
+    so loading or clearing 50k rows costs the same as loading 10.
     """
-    proc_map = {p[0]: {"arrival": p[1], "burst": p[2], "priority": p[3]} for p in processes}
-    done = []
-
-    for pid in proc_map:
-        segs = [s for s in gantt if s[0] == pid]
-        if not segs:
-            continue
-
-        first_start = segs[0][1]
-        completion = max(s[2] for s in segs)
-        arrival = proc_map[pid]["arrival"]
-        burst = proc_map[pid]["burst"]
-
-        tat = completion - arrival
-        wt = tat - burst
-        rt = first_start - arrival
-
-        done.append([pid, arrival, burst, proc_map[pid]["priority"],
-                     completion, tat, wt, rt])
-
-    done.sort(key=lambda x: x[0])
-    return done
-
-# ---------------- scheduling algorithms ----------------
-def fcfs(processes):
-    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
-    gantt = []
-    time = 0
-    for p in procs:
-        if time < p[1]: time = p[1]
-        start = time
-        time += p[2]
-        gantt.append((p[0], start, time))
-    return gantt, _compute_stats_from_gantt(gantt, processes)
-
-def sjf_nonpreemptive(processes):
-    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
-    ready = []
-    gantt = []
-    time = 0
-    while procs or ready:
-        while procs and procs[0][1] <= time:
-            ready.append(procs.pop(0))
-        if ready:
-            ready.sort(key=lambda x: x[2])
-            p = ready.pop(0)
-            start = time
-            time += p[2]
-            gantt.append((p[0], start, time))
-        else:
-            time = procs[0][1] if procs else time
-    return gantt, _compute_stats_from_gantt(gantt, processes)
-
-def sjf_preemptive(processes):
-    # SRTF
-    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
-    rem = {p[0]: p[2] for p in procs}
-    ready = []
-    gantt=[]
-    time=0
-    ai=0
-    while ai<len(procs) or ready:
-        while ai<len(procs) and procs[ai][1]<=time:
-            ready.append(procs[ai]); ai+=1
-        if not ready:
-            time = procs[ai][1]; continue
-        ready.sort(key=lambda x: rem[x[0]])
-        p = ready[0]
-        pid = p[0]
-        start = time
-        time+=1
-        rem[pid]-=1
-        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
-            gantt[-1]=(pid, gantt[-1][1], time)
-        else:
-            gantt.append((pid,start,time))
-        if rem[pid]==0:
-            ready=[r for r in ready if r[0]!=pid]
-    return gantt, _compute_stats_from_gantt(gantt,processes)
-
-def ljf_nonpreemptive(processes):
-    # LONGEST JOB FIRST
-    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
-    ready=[]; gantt=[]; time=0
-    while procs or ready:
-        while procs and procs[0][1]<=time:
-            ready.append(procs.pop(0))
-        if ready:
-            ready.sort(key=lambda x: x[2], reverse=True)
-            p=ready.pop(0)
-            pid,at,bt,pr = p
-            start=time
-            time+=bt
-            gantt.append((pid,start,time))
-        else:
-            time=procs[0][1] if procs else time
-    return gantt,_compute_stats_from_gantt(gantt,processes)
-
-def priority_nonpreemptive(processes):
-    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
-    ready=[]; gantt=[]; time=0
-    while procs or ready:
-        while procs and procs[0][1]<=time:
-            ready.append(procs.pop(0))
-        if ready:
-            ready.sort(key=lambda x:x[3])
-            p=ready.pop(0)
-            start=time
-            time+=p[2]
-            gantt.append((p[0],start,time))
-        else:
-            time=procs[0][1] if procs else time
-    return gantt,_compute_stats_from_gantt(gantt,processes)
-
-def priority_preemptive(processes):
-    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
-    rem={p[0]:p[2] for p in procs}
-    ready=[]; gantt=[]; time=0; ai=0
-    while ai<len(procs) or ready:
-        while ai<len(procs) and procs[ai][1]<=time:
-            ready.append(procs[ai]); ai+=1
-        if not ready:
-            time=procs[ai][1]; continue
-        ready.sort(key=lambda x:(x[3], rem[x[0]]))
-        p=ready[0]; pid=p[0]
-        start=time; time+=1; rem[pid]-=1
-        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
-            gantt[-1]=(pid,gantt[-1][1],time)
-        else:
-            gantt.append((pid,start,time))
-        if rem[pid]==0:
-            ready=[r for r in ready if r[0]!=pid]
-    return gantt,_compute_stats_from_gantt(gantt,processes)
-
-def lrtf_preemptive(processes):
-    # Longest Remaining Time First
-    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
-    rem={p[0]:p[2] for p in procs}
-    ready=[]; gantt=[]; time=0; ai=0
-    while ai<len(procs) or ready:
-        while ai<len(procs) and procs[ai][1]<=time:
-            ready.append(procs[ai]); ai+=1
-        if not ready:
-            time=procs[ai][1]; continue
-        ready.sort(key=lambda x:(-rem[x[0]], x[1]))
-        p=ready[0]; pid=p[0]
-        start=time; time+=1; rem[pid]-=1
-        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
-            gantt[-1]=(pid,gantt[-1][1],time)
+    def __init__(self, parent, columns, height, fmt=tuple, width=100):
+        self.frame=tk.Frame(parent,bg="#0b0d10")
+        self.tree=ttk.Treeview(self.frame,columns=columns,show="headings",height=height)
+        for c in columns:
+            self.tree.heading(c,text=c); self.tree.column(c,width=width,anchor="center")
+        self.sb=ttk.Scrollbar(self.frame,orient="vertical",command=self._on_scroll)
+        self.sb.pack(side="right",fill="y")
+        self.tree.pack(side="left",fill="both",expand=True)
+        self.height=height; self.fmt=fmt
+        self.rows=[]; self.top=0; self.slots=[]; self.selected=set()
+        # user selection only - programmatic selection_set is not tracked
+        self.tree.bind("<ButtonRelease-1>",self._sync_selection)
+        self.tree.bind("<KeyRelease>",self._sync_selection)
+        for ev in ("<MouseWheel>","<Button-4>","<Button-5>"):
+            self.tree.bind(ev,self._on_wheel)
+
+    def pack(self,**kw): self.frame.pack(**kw)
+    def bind(self,ev,fn): self.tree.bind(ev,fn)
+
+    def set_rows(self,rows,keep_view=False):
+        self.rows=rows; self.selected=set()
+        if not keep_view: self.top=0
+        self.refresh()
+
+    def see_end(self):
+        self.top=len(self.rows); self.refresh()
+
+    def selected_rows(self):
+        return [self.rows[i] for i in sorted(self.selected) if i<len(self.rows)]
+
+    def refresh(self):
+        n=len(self.rows)
+        self.top=max(0,min(self.top,n-self.height))
+        want=min(self.height,n)
+        while len(self.slots)<want: self.slots.append(self.tree.insert("", "end"))
+        while len(self.slots)>want: self.tree.delete(self.slots.pop())
+        sel=[]
+        for k,item in enumerate(self.slots):
+            i=self.top+k
+            self.tree.item(item,values=self.fmt(self.rows[i]))
+            if i in self.selected: sel.append(item)
+        self.tree.selection_set(sel)
+        self.sb.set(self.top/n,(self.top+want)/n) if n else self.sb.set(0,1)
+
+    def _sync_selection(self,e):
+        visible=range(self.top,self.top+len(self.slots))
+        if not e.state & 0x0005:        # no Shift/Control: plain click replaces
+            self.selected=set()
+        self.selected-=set(visible)
+        self.selected.update(self.top+self.slots.index(it) for it in self.tree.selection())
+
+    def _on_scroll(self,*args):
+        if args[0]=="moveto":
+            self.top=int(float(args[1])*len(self.rows))
         else:
-            gantt.append((pid,start,time))
-        if rem[pid]==0:
-            ready=[r for r in ready if r[0]!=pid]
-    return gantt,_compute_stats_from_gantt(gantt,processes)
-
-def round_robin(processes, quantum):
-    if quantum<=0: quantum=1
-    procs = sorted([p[:] for p in processes], key=lambda x:x[1])
-    rem={p[0]:p[2] for p in procs}
-    time=0; queue=[]; gantt=[]; ai=0; completed=set()
-    total=len(procs)
-    while len(completed)<total:
-        while ai<len(procs) and procs[ai][1]<=time:
-            queue.append(procs[ai]); ai+=1
-        if not queue:
-            time=procs[ai][1]; continue
-        p=queue.pop(0); pid=p[0]
-        start=time
-        exec_t=min(quantum, rem[pid])
-        time+=exec_t; rem[pid]-=exec_t
-        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
-            gantt[-1]=(pid,gantt[-1][1],time)
-        else:
-            gantt.append((pid,start,time))
-        while ai<len(procs) and procs[ai][1]<=time:
-            queue.append(procs[ai]); ai+=1
-        if rem[pid]==0:
-            completed.add(pid)
-        else:
-            queue.append(p)
-    return gantt,_compute_stats_from_gantt(gantt,processes)
+            self.top+=int(args[1])*(self.height if args[2]=="pages" else 1)
+        self.refresh()
+
+    def _on_wheel(self,e):
+        self.top+=-3 if (e.num==4 or e.delta>0) else 3
+        self.refresh()
+        return "break"
 
 # ---------------- main app ----------------
 class CPUSchedulerApp:
@@ -218,13 +102,19 @@ class CPUSchedulerApp:
         root.geometry("1300x820")
         root.configure(bg="#0b0d10")
 
-        self.processes=[]
-        self.last_gantt=[]
+        self.proc_map={}        # pid -> [pid, arrival, burst, priority], in input order
+        self._proc_list=None; self._proc_fp=None
+        self._added={}; self._removed={}   # rows changed since the last session run, by pid
+        self.last_gantt=[]; self.last_fig=None; self._gantt_fp=None
         self.last_done=[]
 
         self.dark=True
         self.is_playing=False
         self.play_index=0
+        self.play_pos=0.0
+        self.cursor=None
+        self.job=None
+        self.session=SimulationSession()   # keeps the last run's schedule: edits only redo the tail
 
         self._build_ui()
 
@@ -261,6 +151,8 @@ class CPUSchedulerApp:
         misc=tk.Frame(left,bg="#0b0d10"); misc.pack(pady=6)
         self._btn(misc,"🎲 Random",self.add_random).pack(side="left",padx=5)
         self._btn(misc,"🧹 Clear",self.clear_all).pack(side="left",padx=5)
+        self._btn(misc,"📂 Open",self.open_file).pack(side="left",padx=5)
+        self._btn(misc,"💾 Save",self.save_session).pack(side="left",padx=5)
         self._btn(misc,"🌗 Theme",self.toggle_theme).pack(side="left",padx=5)
 
         # Controls
@@ -269,16 +161,7 @@ class CPUSchedulerApp:
 
         tk.Label(card_ctrl,text="Algorithm",bg="#0b0d10",fg="#BFF3FF").grid(row=0,column=0,sticky="w")
         self.algo_var=tk.StringVar(value="FCFS")
-        algo_list=[
-            "FCFS",
-            "SJF (Non-Preemptive)",
-            "SJF (Preemptive)",
-            "LJF (Non-Preemptive)",
-            "Priority (Non-Preemptive)",
-            "Priority (Preemptive)",
-            "LRTF (Preemptive)",
-            "Round Robin"
-        ]
+        algo_list=list(ALGORITHM_LABELS)
         ttk.Combobox(card_ctrl,textvariable=self.algo_var,values=algo_list,width=30)\
             .grid(row=1,column=0,pady=6,sticky="w")
 
@@ -292,6 +175,12 @@ class CPUSchedulerApp:
         self._btn(run_bar,"⏯ Play",self.toggle_play).pack(side="left",padx=5)
         self._btn(run_bar,"🖼 Save Chart",self.save_chart).pack(side="left",padx=5)
 
+        sf=tk.Frame(card_ctrl,bg="#0b0d10"); sf.grid(row=4,column=0,sticky="w")
+        tk.Label(sf,text="Play speed:",bg="#0b0d10",fg="#BFF3FF").pack(side="left")
+        self.speed_var=tk.StringVar(value="1x")
+        ttk.Combobox(sf,textvariable=self.speed_var,values=PLAY_SPEEDS,width=8)\
+            .pack(side="left",padx=6)
+
         # TABLE SECTION
         center=tk.Frame(main,bg="#0b0d10")
         center.pack(side="left",fill="both",expand=True)
@@ -300,18 +189,15 @@ class CPUSchedulerApp:
         p_card.pack(fill="both",padx=6,pady=6)
 
         cols=("PID","Arrival","Burst","Priority")
-        self.table=ttk.Treeview(p_card,columns=cols,show="headings",height=7)
-        for c in cols:
-            self.table.heading(c,text=c); self.table.column(c,width=100,anchor="center")
+        self.table=VirtualTable(p_card,cols,7)
         self.table.pack(fill="both",expand=True)
         self.table.bind("<Delete>",lambda e:self.delete_selected())
 
         s_card=tk.LabelFrame(center,text="Stats",bg="#0b0d10",fg="#BFF3FF")
         s_card.pack(fill="x",padx=6,pady=(6,0))
 
-        self.stats=ttk.Treeview(s_card,columns=("PID","CT","TAT","WT","RT"),show="headings",height=6)
-        for c in ("PID","CT","TAT","WT","RT"):
-            self.stats.heading(c,text=c); self.stats.column(c,width=90,anchor="center")
+        self.stats=VirtualTable(s_card,("PID","CT","TAT","WT","RT"),6,
+                                fmt=lambda p:(p[0],p[4],p[5],p[6],p[7]),width=90)
         self.stats.pack(fill="x")
 
         # BOTTOM — Averages + Gantt
@@ -326,6 +212,16 @@ class CPUSchedulerApp:
         self.avg_tat.pack(side="left",padx=10)
         self.avg_wt.pack(side="left",padx=10)
         self.avg_rt.pack(side="left",padx=10)
+        self.engine=tk.Label(avg,text="",bg="#0b0d10",fg="#8FA3B8",font=("Segoe UI",10))
+        self.engine.pack(side="left",padx=10)
+
+        self.cancel_btn=self._btn(avg,"✖ Cancel",self.cancel_simulation)
+        self.cancel_btn.config(state="disabled")
+        self.cancel_btn.pack(side="right",padx=5)
+        self.progress=ttk.Progressbar(avg,length=220,maximum=1.0)
+        self.progress.pack(side="right",padx=10)
+        self.status=tk.Label(avg,text="",bg="#0b0d10",fg="#BFF3FF")
+        self.status.pack(side="right")
 
         g_card=tk.LabelFrame(bottom,text="Gantt Chart",bg="#0b0d10",fg="#BFF3FF")
         g_card.pack(fill="both",expand=True)
@@ -336,6 +232,12 @@ class CPUSchedulerApp:
         self.legend=tk.Frame(g_card,bg="#0b0d10")
         self.legend.pack(fill="x",pady=6)
 
+        # playback scrub bar: drag to seek
+        self.scrub=tk.Scale(g_card,from_=0,to=0,orient="horizontal",showvalue=False,
+                            bg="#0b0d10",troughcolor="#0f1113",highlightthickness=0,
+                            command=self._seek)
+        self.scrub.pack(fill="x")
+
     # ------------- BUTTON helper -------------
     def _btn(self,parent,text,cmd):
         return tk.Button(parent,text=text,command=cmd,
@@ -343,103 +245,173 @@ class CPUSchedulerApp:
                          font=("Segoe UI",9,"bold"),bd=0,padx=8,pady=6)
 
     # ------------- PROCESS OPS -------------
+    @property
+    def processes(self):
+        # list view for the schedulers and the table, rebuilt once after changes
+        if self._proc_list is None:
+            self._proc_list=list(self.proc_map.values())
+        return self._proc_list
+
+    def _fingerprint(self):
+        if self._proc_fp is None:
+            self._proc_fp=workload_fingerprint(self.processes)
+        return self._proc_fp
+
+    def _unique_pid(self,pid):
+        base=pid;i=1
+        while pid in self.proc_map:
+            pid=f"{base}_{i}";i+=1
+        return pid
+
+    def add_processes(self,rows):
+        """Bulk add [pid, arrival, burst, priority] rows (PIDs made unique)."""
+        for r in rows:
+            pid=self._unique_pid(r[0])
+            self.proc_map[pid]=self._added[pid]=[pid,r[1],r[2],r[3]]
+        self._proc_list=None; self._proc_fp=None
+        self.table.set_rows(self.processes)
+        self.table.see_end()
+
     def add_process(self):
         try:
-            pid=self.entries["PID"].get().strip() or f"P{len(self.processes)+1}"
+            pid=self.entries["PID"].get().strip() or f"P{len(self.proc_map)+1}"
             at=int(self.entries["Arrival"].get())
             bt=int(self.entries["Burst"].get())
             pr=int(self.entries["Priority"].get())
         except:
             messagebox.showerror("Invalid","Enter numeric values.")
             return
-        base=pid;i=1
-        while any(p[0]==pid for p in self.processes):
-            pid=f"{base}_{i}";i+=1
-        self.processes.append([pid,at,bt,pr])
-        self.table.insert("", "end", values=(pid,at,bt,pr))
+        self.add_processes([[pid,at,bt,pr]])
         for e in self.entries.values(): e.delete(0,tk.END)
 
     def add_random(self):
-        idx=len(self.processes)+1
+        idx=len(self.proc_map)+1
         pid=f"P{idx}"; at=random.randint(0,6); bt=random.randint(1,12); pr=random.randint(1,10)
-        self.processes.append([pid,at,bt,pr])
-        self.table.insert("", "end", values=(pid,at,bt,pr))
+        self.add_processes([[pid,at,bt,pr]])
+
+    def _remove(self,pids):
+        for pid in pids:
+            row=self.proc_map.pop(pid,None)
+            if row is None: continue
+            if self._added.pop(pid,None) is None: self._removed[pid]=row
+        self._proc_list=None; self._proc_fp=None
+        self.table.set_rows(self.processes,keep_view=True)
 
     def edit_selected(self):
-        sel=self.table.selection()
+        sel=self.table.selected_rows()
         if not sel:
             messagebox.showinfo("Select","Select a process."); return
-        item=sel[0]
-        pid,at,bt,pr=self.table.item(item,"values")
+        pid,at,bt,pr=sel[0]
         # load into fields
         self.entries["PID"].delete(0,tk.END); self.entries["PID"].insert(0,pid)
         self.entries["Arrival"].delete(0,tk.END); self.entries["Arrival"].insert(0,at)
         self.entries["Burst"].delete(0,tk.END); self.entries["Burst"].insert(0,bt)
         self.entries["Priority"].delete(0,tk.END); self.entries["Priority"].insert(0,pr)
         # remove from list
-        self.processes=[p for p in self.processes if p[0]!=pid]
-        self.table.delete(item)
+        self._remove([pid])
 
     def delete_selected(self):
-        sel=self.table.selection()
+        sel=self.table.selected_rows()
         if not sel: return
-        for item in sel:
-            pid=self.table.item(item,"values")[0]
-            self.processes=[p for p in self.processes if p[0]!=pid]
-            self.table.delete(item)
+        self._remove([p[0] for p in sel])
 
     def clear_all(self):
-        self.processes=[]
-        for w in self.table.get_children(): self.table.delete(w)
-        for w in self.stats.get_children(): self.stats.delete(w)
+        self.proc_map={}; self._proc_list=None; self._proc_fp=None
+        self._added={}; self._removed={}
+        if self.job is not None:
+            # detach it too: a result that comes in anyway is for the old workload
+            self.job.cancel(); self._end_job("")
+        self.is_playing=False; self.cursor=None; self.last_gantt=[]; self.last_done=[]; self.last_fig=None
+        self.session.close()
+        self.scrub.config(to=0)
+        self.table.set_rows([])
+        self.stats.set_rows([])
         for w in self.canvas_frame.winfo_children(): w.destroy()
         for w in self.legend.winfo_children(): w.destroy()
         self.avg_tat.config(text="Avg TAT: —")
         self.avg_wt.config(text="Avg WT: —")
         self.avg_rt.config(text="Avg RT: —")
+        self.engine.config(text="")
 
     # ------------- RUN SIMULATION -------------
     def run_simulation(self):
         if not self.processes:
             messagebox.showinfo("No Data","Add processes first."); return
+        if self.job is not None:
+            messagebox.showinfo("Busy","A simulation is already running."); return
         algo=self.algo_var.get()
-        data=[p[:] for p in self.processes]
 
         try: q=int(self.q_entry.get())
         except: q=2
 
-        if algo=="FCFS":
-            g,d=fcfs(data)
-        elif algo=="SJF (Non-Preemptive)":
-            g,d=sjf_nonpreemptive(data)
-        elif algo=="SJF (Preemptive)":
-            g,d=sjf_preemptive(data)
-        elif algo=="LJF (Non-Preemptive)":
-            g,d=ljf_nonpreemptive(data)
-        elif algo=="Priority (Non-Preemptive)":
-            g,d=priority_nonpreemptive(data)
-        elif algo=="Priority (Preemptive)":
-            g,d=priority_preemptive(data)
-        elif algo=="LRTF (Preemptive)":
-            g,d=lrtf_preemptive(data)
-        else:
-            g,d=round_robin(data,q)
-
-        self.last_gantt=g; self.last_done=d
-
-        # stats table
-        for w in self.stats.get_children(): self.stats.delete(w)
-        for p in d:
-            self.stats.insert("", "end",
-                values=(p[0], p[4], p[5], p[6], p[7]))
+        name=ALGORITHM_LABELS.get(algo,"round_robin")
+        self._job_fp=self._fingerprint()
+        self._job_key=cache_key(self._job_fp,name,q)
+        hit=RESULT_CACHE.get(self._job_key)
+        if hit is not None:
+            self.status.config(text="Cached")
+            self._apply_results(self._job_fp,*hit); return
+
+        # scheduling runs off the Tk thread; _poll_job picks up the result.
+        # The session resumes from its last checkpoint before the first edit,
+        # and only needs the edits if its last run was for the same algorithm.
+        self._job_n=len(self.processes)
+        edits=(list(self._added.values()),list(self._removed.values()))
+        self._added={}; self._removed={}
+        self.job=self.session.run(name,self.processes,q,instrument=True,edits=edits)
+        self.progress["value"]=0
+        self.status.config(text="Running…")
+        self.cancel_btn.config(state="normal")
+        self.root.after(POLL_MS,self._poll_job)
+
+    def cancel_simulation(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.status.config(text="Cancelling…")
+
+    def _poll_job(self):
+        job=self.job
+        if job is None: return
+        for kind,val in job.poll():
+            if kind=="progress":
+                self.progress["value"]=val
+            elif kind=="done":
+                RESULT_CACHE.put(self._job_key,val)
+                n=self._job_n
+                self._end_job(f"Resumed: {n-job.resumed_at} of {n} rescheduled" if job.resumed_at else "")
+                self._apply_results(self._job_fp,*val)   # processes may have changed since
+            elif kind=="cancelled":
+                self._end_job("Cancelled")
+            elif kind=="error":
+                self._end_job("Failed")
+                messagebox.showerror("Simulation failed",val)
+        if self.job is job:
+            self.root.after(POLL_MS,self._poll_job)
+
+    def _end_job(self,text):
+        self.job=None
+        self.status.config(text=text)
+        self.cancel_btn.config(state="disabled")
+
+    def _apply_results(self,fp,g,d,m=None):
+        # fp: fingerprint of the processes g was computed for
+        self.last_gantt=g; self.last_done=d; self._gantt_fp=fp
 
         # averages
-        avg_tat=sum(p[5] for p in d)/len(d)
-        avg_wt=sum(p[6] for p in d)/len(d)
-        avg_rt=sum(p[7] for p in d)/len(d)
-        self.avg_tat.config(text=f"Avg TAT: {avg_tat:.2f}")
-        self.avg_wt.config(text=f"Avg WT: {avg_wt:.2f}")
-        self.avg_rt.config(text=f"Avg RT: {avg_rt:.2f}")
+        agg=aggregate_stats(d)
+        if d:
+            self.avg_tat.config(text=f"Avg TAT: {agg['avg_tat']:.2f}")
+            self.avg_wt.config(text=f"Avg WT: {agg['avg_wt']:.2f}  (p90 {agg['p90_wt']}, max {agg['max_wt']})")
+            self.avg_rt.config(text=f"Avg RT: {agg['avg_rt']:.2f}")
+        if not m:
+            self.engine.config(text="")
+        else:
+            self.engine.config(text=f"Switches {m['context_switches']} · Idle {m['idle']} · "
+                                    f"Thru {m['throughput']:.3f}/t · Queue avg {m['avg_queue']:.1f} max {m['max_queue']} · "
+                                    f"{m['decision_avg_us']:.1f} µs/decision")
+
+        # stats table - virtual, so no per-row widgets to build
+        self.stats.set_rows(d)
 
         self._draw_gantt(g)
 
@@ -450,65 +422,79 @@ class CPUSchedulerApp:
 
         fig=Figure(figsize=(12,4),dpi=100)
         ax=fig.add_subplot(111)
+        ax.set_xlabel("Time")
+        ax.grid(axis='x',linestyle=':',alpha=0.5)
+        view=GanttView(ax, gantt)
 
-        pids=list(dict.fromkeys(s[0] for s in gantt))
-        ymap={pid:i+1 for i,pid in enumerate(pids)}
-
-        for pid in pids:
+        for pid in view.pids[:LEGEND_MAX]:
             col=pid_color(pid)
             tk.Label(self.legend,text=pid,bg=col,fg=text_contrast(col),
                      padx=6,pady=3).pack(side="left",padx=5)
+        if len(view.pids)>LEGEND_MAX:
+            tk.Label(self.legend,text=f"+{len(view.pids)-LEGEND_MAX} more",
+                     bg="#0b0d10",fg="#BFF3FF").pack(side="left",padx=5)
 
-        for pid,s,e in gantt:
-            y=ymap[pid]
-            col=pid_color(pid)
-            ax.barh(y, e-s, left=s, color=col, edgecolor="black", height=0.6)
-            ax.text((s+e)/2, y, pid, color=text_contrast(col), ha="center", va="center")
-
-        ax.set_yticks(list(ymap.values()))
-        ax.set_yticklabels(list(ymap.keys()))
-        ax.set_xlabel("Time")
-        ax.grid(axis='x',linestyle=':',alpha=0.5)
-
-        ticks=sorted(set(itertools.chain.from_iterable([(s,e) for _,s,e in gantt])))
-        ax.set_xticks(ticks)
         fig.tight_layout()
+        self.last_fig=fig
 
         canvas=FigureCanvasTkAgg(fig,master=self.canvas_frame)
+        NavigationToolbar2Tk(canvas,self.canvas_frame)   # zoom / pan
+        canvas.mpl_connect("resize_event",lambda e:view.refresh())
+        view.refresh()
+        self.is_playing=False; self.play_index=0
+        self.cursor=PlaybackCursor(ax,gantt,view.ymap) if gantt else None
+        self.scrub.config(to=max(len(gantt)-1,0))
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both",expand=True)
+        self.gantt_view=view
         if _HAS_MPLCURSORS:
-            try:mplcursors.cursor(ax.get_children(),hover=True)
+            try:mplcursors.cursor(ax.collections,hover=True)
             except:pass
 
     # ------------- PLAYBACK -------------
+    def _speed(self):
+        # segments per second
+        try: mult=float(self.speed_var.get().rstrip("x"))
+        except ValueError: mult=1.0
+        return max(mult,0.01)/PLAY_STEP_S
+
     def toggle_play(self):
-        if not self.last_gantt: return
+        if not self.last_gantt or self.cursor is None: return
         self.is_playing=not self.is_playing
         if self.is_playing:
-            self.play_index=0
-            self._play_step()
+            if self.play_index>=len(self.last_gantt)-1:
+                self.play_index=0
+            self.play_pos=float(self.play_index)
+            self._play_t=time.perf_counter()
+            self._show_step(self.play_index)
+            self.root.after(FRAME_MS,self._play_step)
 
     def _play_step(self):
+        # advance by wall-clock time, so fast speeds skip frames instead of lagging
         if not self.is_playing: return
-        if self.play_index>=len(self.last_gantt):
+        now=time.perf_counter()
+        self.play_pos+=(now-self._play_t)*self._speed()
+        self._play_t=now
+        i=min(int(self.play_pos),len(self.last_gantt)-1)
+        if i!=self.play_index:
+            self._show_step(i)
+        if i>=len(self.last_gantt)-1:
             self.is_playing=False; return
-
-        pid,s,e=self.last_gantt[self.play_index]
-        for w in self.canvas_frame.winfo_children(): w.destroy()
-
-        fig=Figure(figsize=(12,2),dpi=100)
-        ax=fig.add_subplot(111)
-        col=pid_color(pid)
-        ax.barh(1,e-s,left=s,color=col,height=0.6)
-        ax.set_yticks([]); ax.set_xlabel("Time")
-        ax.set_xlim(max(0,s-2), e+2)
-        canvas=FigureCanvasTkAgg(fig,master=self.canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both",expand=True)
-
-        self.play_index+=1
-        self.root.after(700,self._play_step)
+        self.root.after(FRAME_MS,self._play_step)
+
+    def _show_step(self,i):
+        self.play_index=i
+        self.cursor.show(i)
+        self.scrub.set(i)
+
+    def _seek(self,value):
+        # Tk calls this later for our own scrub.set() too: skip where we already are
+        if self.cursor is None or not self.last_gantt: return
+        i=int(float(value))
+        if i==self.play_index: return
+        self.play_pos=float(i)
+        self._play_t=time.perf_counter()
+        self._show_step(i)
 
     # ------------- MISC -------------
     def toggle_theme(self):
@@ -518,13 +504,43 @@ class CPUSchedulerApp:
         self.root.configure(bg=bg)
 
     def save_chart(self):
-        if not hasattr(self,"last_fig"):
+        if self.last_fig is None:
             messagebox.showinfo("No chart","Run simulation first.")
             return
-        path=filedialog.asksaveasfilename(defaultextension=".png")
+        path=filedialog.asksaveasfilename(defaultextension=".png",
+            filetypes=[("PNG","*.png"),("SVG","*.svg"),("PDF","*.pdf")])
         if not path: return
         self.last_fig.savefig(path, dpi=150)
 
+    # ------------- FILES -------------
+    def open_file(self):
+        path=filedialog.askopenfilename(filetypes=[("Workload / session","*.sched *.csv *.json *.jsonl"),
+                                                   ("All files","*.*")])
+        if not path: return
+        try:
+            if path.lower().endswith(".sched"): procs,g=scheduler_io.load(path)
+            else: procs,g=scheduler_io.load_workload(path),None
+        except (OSError,ValueError) as e:
+            messagebox.showerror("Open failed",str(e)); return
+        self.clear_all()
+        if procs is not None: self.add_processes([list(p) for p in procs])
+        if g is not None and len(g):
+            self._apply_results(self._fingerprint(),g,_compute_stats_from_gantt(g,self.processes))
+
+    def save_session(self):
+        if not self.processes:
+            messagebox.showinfo("No Data","Add processes first."); return
+        path=filedialog.asksaveasfilename(defaultextension=".sched",
+            filetypes=[("Session","*.sched"),("CSV","*.csv"),("JSON","*.json"),("JSON Lines","*.jsonl")])
+        if not path: return
+        # the schedule goes along only if it was computed for these processes
+        g=self.last_gantt if self.last_gantt and self._gantt_fp==self._fingerprint() else None
+        try:
+            if path.lower().endswith(".sched"): scheduler_io.save(path,self.processes,g)
+            else: scheduler_io.write_workload(self.processes,path)
+        except (OSError,ValueError) as e:
+            messagebox.showerror("Save failed",str(e))
+
 # RUN APP
 if __name__=="__main__":
     root=tk.Tk()
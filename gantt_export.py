@@ -0,0 +1,160 @@
+# gantt_export.py
+# Headless Gantt export: schedules rendered to PNG/SVG/PDF on a process pool,
+# through the Agg/SVG/PDF canvases only - no Tk, no pyplot.
+#   python gantt_export.py workload.csv --seeds 0-99 -a all -q 2 -o charts -f png -f svg
+#   python gantt_export.py run1.sched run2.sched -o charts   (schedules saved by scheduler_io)
+import argparse, os, sys
+from multiprocessing import Pool, cpu_count
+from matplotlib import rc_context
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import scheduler_core as core
+import scheduler_io
+from gantt_render import GanttView
+from scheduler_sweep import _load, _parse_seeds
+
+FORMATS = ("png", "svg", "pdf")
+# no timestamps (and fixed SVG ids below): a schedule always gives the same file
+_METADATA = {"png": {}, "svg": {"Date": None}, "pdf": {"CreationDate": None}}
+
+def _check_formats(formats):
+    bad = sorted(set(formats) - set(FORMATS))
+    if bad or not formats:
+        raise ValueError(f"formats must be some of {', '.join(FORMATS)}, not {bad or 'none'}")
+
+class ChartTemplate:
+    """
+    Figure and Axes set up once and reused for every chart: render() swaps
+    the previous GanttView for a new one - axes, spines and tick artists
+    stay - and saves each format, so a chart costs its drawing and encoding
+    only. PID colors come from gantt_render.pid_color and match across
+    processes, runs and the GUI.
+    """
+    def __init__(self, size=(12, 4), dpi=100, formats=("png",)):
+        _check_formats(formats)
+        self.formats = tuple(formats)
+        self.fig = Figure(figsize=size, dpi=dpi)
+        FigureCanvasAgg(self.fig)     # savefig switches to the SVG/PDF canvas by format
+        self.fig.subplots_adjust(left=0.07, right=0.99, top=0.9, bottom=0.12)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_xlabel("Time")
+        self.ax.grid(axis="x", linestyle=":", alpha=0.5)
+        self.view = None
+
+    def render(self, gantt, out, title=None):
+        """Write out.<format> for each format; returns the paths."""
+        if self.view is not None:
+            self.view.remove()
+        self.ax.set_title(title or "")
+        self.ax.set_xlim(0, 1)        # what an empty schedule shows
+        self.view = GanttView(self.ax, gantt)
+        paths = []
+        with rc_context({"svg.hashsalt": "gantt_export"}):
+            for fmt in self.formats:
+                path = f"{out}.{fmt}"
+                self.fig.savefig(path, format=fmt, metadata=_METADATA[fmt])
+                paths.append(path)
+        return paths
+
+# ---------------- pool workers ----------------
+_TEMPLATE = None
+
+def _init(size, dpi, formats):
+    global _TEMPLATE
+    _TEMPLATE = ChartTemplate(size, dpi, formats)
+
+def _gantt(source, algorithm, quantum):
+    if algorithm is not None:
+        return core.run_algorithm(algorithm, _load(source), quantum)[0]
+    if isinstance(source, str):
+        gantt = scheduler_io.load(source)[1]
+        if gantt is None:
+            raise ValueError(f"{source}: no schedule stored (give an algorithm)")
+        return gantt
+    return source
+
+def _render(job):
+    source, algorithm, quantum, out, title = job
+    return _TEMPLATE.render(_gantt(source, algorithm, quantum), out, title)
+
+def export_charts(jobs, formats=("png",), workers=None, size=(12, 4), dpi=100):
+    """
+    Render jobs = [(source, algorithm, quantum, out, title)], yielding each
+    job's written paths as it finishes. With an algorithm, source is a
+    scheduler_sweep workload spec - (path, None, None) or (None, seed, n) -
+    scheduled inside the worker; without one, it is a Gantt list /
+    SegmentStore or the path of a .sched file holding a schedule.
+    workers=1 renders in-process.
+    """
+    _check_formats(formats)
+    jobs = list(jobs)
+    workers = workers or cpu_count()
+    if workers == 1 or len(jobs) <= 1:
+        _init(size, dpi, formats)
+        for job in jobs:
+            yield _render(job)
+        return
+    workers = min(workers, len(jobs))
+    with Pool(workers, _init, (size, dpi, formats)) as pool:
+        yield from pool.imap_unordered(_render, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+
+def make_jobs(inputs=(), algorithms=(), quanta=(2,), seeds=(), n=1000, outdir="."):
+    """
+    Jobs for export_charts named <workload>_<algorithm>[_q<quantum>] in
+    outdir; without algorithms, inputs are .sched files with a schedule.
+    """
+    specs = [(p, None, None) for p in inputs] + [(None, s, n) for s in seeds]
+    jobs = []
+    for spec in specs:
+        stem = os.path.splitext(os.path.basename(spec[0]))[0] if spec[0] else f"seed{spec[1]}"
+        if not algorithms:
+            jobs.append((spec[0], None, None, os.path.join(outdir, stem), stem))
+            continue
+        for a in algorithms:
+            for q in (quanta if a in core.QUANTUM_ALGORITHMS else [None]):
+                label = a if q is None else f"{a}_q{q}"
+                title = f"{stem} - {a}" + ("" if q is None else f" (q={q})")
+                jobs.append((spec, a, q, os.path.join(outdir, f"{stem}_{label}"), title))
+    return jobs
+
+def _parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return float(w), float(h)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render Gantt charts to files, in parallel and without a display.")
+    ap.add_argument("inputs", nargs="*",
+                    help="workload files; with no -a, .sched files holding a schedule")
+    ap.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                    choices=sorted(core.ALGORITHMS) + ["all"], help="repeatable")
+    ap.add_argument("-q", "--quantum", action="append", type=int, dest="quanta",
+                    help="Round Robin quantum, MLFQ top-level quantum (repeatable, default: 2)")
+    ap.add_argument("--seeds", type=_parse_seeds, default=[],
+                    help="random workload seeds, e.g. 0-99 or 1,5,7 (needs -a)")
+    ap.add_argument("-n", type=int, default=1000, help="processes per random workload")
+    ap.add_argument("-o", "--outdir", default=".", help="output directory (default: .)")
+    ap.add_argument("-f", "--format", action="append", dest="formats", choices=FORMATS,
+                    help="repeatable, default: png")
+    ap.add_argument("-j", "--workers", type=int, help="worker processes (default: all cores)")
+    ap.add_argument("--size", type=_parse_size, default=(12, 4), help="inches, e.g. 12x4")
+    ap.add_argument("--dpi", type=int, default=100)
+    args = ap.parse_args(argv)
+    algorithms = args.algorithms or []
+    if "all" in algorithms:
+        algorithms = list(core.ALGORITHMS)
+    if not args.inputs and not args.seeds:
+        ap.error("give workload / schedule files and/or --seeds")
+    if args.seeds and not algorithms:
+        ap.error("--seeds needs -a")
+    os.makedirs(args.outdir, exist_ok=True)
+    jobs = make_jobs(args.inputs, algorithms, args.quanta or [2], args.seeds, args.n, args.outdir)
+    try:
+        for paths in export_charts(jobs, args.formats or ["png"], args.workers, args.size, args.dpi):
+            print(*paths, sep="\n", flush=True)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# gantt_render.py
+# Gantt drawing on a Matplotlib Axes - no Tk, so it works on any backend.
+import hashlib
+from functools import lru_cache
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import MaxNLocator
+from scheduler_core import SegmentStore
+
+# ---------------- helper visuals ----------------
+@lru_cache(maxsize=65536)
+def pid_color(pid):
+    # md5, not hash(): str hashes are salted per interpreter run
+    return "#" + hashlib.md5(str(pid).encode()).hexdigest()[:6].upper()
+
+def text_contrast(hex_color):
+    hex_color = hex_color.lstrip("#")
+    r, g, b = int(hex_color[0:2],16), int(hex_color[2:4],16), int(hex_color[4:6],16)
+    lum = 0.2126*r + 0.7152*g + 0.0722*b
+    return "black" if lum > 150 else "white"
+
+def _rects(s, e, y):
+    # (n, 4, 2) rectangle vertices for bars [s, e) centred on rows y
+    v = np.empty((len(s), 4, 2))
+    v[:, 0, 0] = v[:, 1, 0] = s
+    v[:, 2, 0] = v[:, 3, 0] = e
+    v[:, 0, 1] = v[:, 3, 1] = y - 0.3
+    v[:, 1, 1] = v[:, 2, 1] = y + 0.3
+    return v
+
+# ---------------- Gantt view ----------------
+class GanttView:
+    """
+    One lane per PID. Each lane is a single PolyCollection whose vertices are
+    swapped in place on refresh(); past MAX_LANE_ARTISTS visible lanes they
+    are folded into one shared collection. refresh() - run on every zoom /
+    pan / resize - keeps only the visible window, merges segments less than
+    a pixel apart and adds labels and boundary ticks only where they fit, so
+    redraw cost follows the pixel size of the axes, not the trace length.
+    """
+    CHAR_PX = 7          # approx. width of one label character
+    TICK_PX = 40         # min spacing for segment-boundary ticks
+    MAX_LABELS = 300
+    YLABEL_PX = 14       # min spacing for PID labels on the y axis
+    MAX_LANE_ARTISTS = 150
+
+    def __init__(self, ax, gantt):
+        self.ax = ax
+        if isinstance(gantt, SegmentStore):
+            # PID indices are already lanes in order of first appearance
+            self.pids = list(gantt.pids)
+            pid, start, end = gantt.as_numpy()
+            lane, start, end = pid.astype(np.int64), start.astype(float), end.astype(float)
+        else:
+            self.pids = list(dict.fromkeys(s[0] for s in gantt))
+            ymap = {pid: i for i, pid in enumerate(self.pids)}
+            lane = np.fromiter((ymap[g[0]] for g in gantt), dtype=np.int64, count=len(gantt))
+            start = np.fromiter((g[1] for g in gantt), dtype=float, count=len(gantt))
+            end = np.fromiter((g[2] for g in gantt), dtype=float, count=len(gantt))
+        self.ymap = {pid: i+1 for i, pid in enumerate(self.pids)}
+        # a single CPU never overlaps a lane with itself: sort by (lane, start)
+        order = np.lexsort((start, lane))
+        self.lane, self.start, self.end = lane[order], start[order], end[order]
+        self.offsets = np.searchsorted(self.lane, np.arange(len(self.pids) + 1))
+        self.colors = [pid_color(p) for p in self.pids]
+        self.label_px = np.array([len(p) * self.CHAR_PX + 4 for p in self.pids])
+        self._lanes = {}            # lane index -> PolyCollection, made on demand
+        self._bulk = None
+        self._texts = []
+        self._busy = False
+
+        ys = list(self.ymap.values())
+        rows = max(1, int(ax.get_window_extent().height // self.YLABEL_PX))
+        step = max(1, -(-len(ys) // rows))
+        ax.set_yticks(ys[::step])
+        ax.set_yticklabels(self.pids[::step])
+        ax.set_ylim(0.4, len(ys) + 0.6)
+        if gantt:
+            t0, t1 = self.start.min(), self.end.max()
+            pad = max((t1 - t0) * 0.01, 0.5)
+            ax.set_xlim(t0 - pad, t1 + pad)
+        self._cids = [ax.callbacks.connect("xlim_changed", lambda a: self.refresh()),
+                      ax.callbacks.connect("ylim_changed", lambda a: self.refresh())]
+        self.refresh()
+
+    def remove(self):
+        """Take this view's artists and callbacks off the axes, leaving them reusable."""
+        for cid in self._cids: self.ax.callbacks.disconnect(cid)
+        for a in self._texts + list(self._lanes.values()) + ([self._bulk] if self._bulk else []):
+            a.remove()
+        self._texts = []; self._lanes = {}; self._bulk = None
+
+    def refresh(self):
+        if self._busy:
+            return
+        self._busy = True
+        try:
+            self._redraw()
+        finally:
+            self._busy = False
+
+    def _visible(self, x0, x1, y0, y1, gap):
+        """(lane, start, end) of bars in the window, merging gaps under `gap`."""
+        l0 = max(0, int(np.ceil(y0 - 1.3))); l1 = min(len(self.pids) - 1, int(np.floor(y1 - 0.7)))
+        if l1 < l0:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        a, b = self.offsets[l0], self.offsets[l1 + 1]
+        l, s, e = self.lane[a:b], self.start[a:b], self.end[a:b]
+        keep = (s < x1) & (e > x0)
+        l, s, e = l[keep], s[keep], e[keep]
+        if len(s) < 2:
+            return l, s, e
+        brk = np.flatnonzero((l[1:] != l[:-1]) | (s[1:] - e[:-1] >= gap))
+        first = np.r_[0, brk + 1]; last = np.r_[brk, len(s) - 1]
+        return l[first], s[first], e[last]
+
+    def _lane_artist(self, i):
+        c = self._lanes.get(i)
+        if c is None:
+            c = PolyCollection([], facecolors=self.colors[i])
+            self.ax.add_collection(c, autolim=False)
+            self._lanes[i] = c
+        return c
+
+    def _redraw(self):
+        ax = self.ax
+        for t in self._texts: t.remove()
+        self._texts = []
+        x0, x1 = ax.get_xlim(); y0, y1 = ax.get_ylim()
+        width_px = max(ax.get_window_extent().width, 1.0)
+        ppu = width_px / max(x1 - x0, 1e-12)          # pixels per time unit
+        l, s, e = self._visible(x0, x1, y0, y1, 1.0 / ppu)
+        sparse = len(s) * 4 < width_px
+        edge = dict(edgecolors="black", linewidths=0.8) if sparse else dict(edgecolors="face", linewidths=0)
+
+        lanes = np.unique(l)
+        for c in self._lanes.values(): c.set_visible(False)
+        if self._bulk is not None: self._bulk.set_visible(False)
+        if len(lanes) <= self.MAX_LANE_ARTISTS:
+            cuts = np.searchsorted(l, lanes, "right")
+            a = 0
+            for i, b in zip(lanes.tolist(), cuts.tolist()):
+                c = self._lane_artist(i)
+                c.set_verts(_rects(s[a:b], e[a:b], i + 1)); c.set(**edge); c.set_visible(True)
+                a = b
+        elif len(l):
+            if self._bulk is None:
+                self._bulk = PolyCollection([])
+                ax.add_collection(self._bulk, autolim=False)
+            self._bulk.set_verts(_rects(s, e, l + 1))
+            self._bulk.set_facecolors([self.colors[i] for i in l.tolist()])
+            self._bulk.set(**edge); self._bulk.set_visible(True)
+
+        fits = np.flatnonzero((e - s) * ppu >= self.label_px[l])[:self.MAX_LABELS]
+        for i in fits.tolist():
+            pid = self.pids[l[i]]; col = self.colors[l[i]]
+            self._texts.append(ax.text(
+                (max(s[i], x0) + min(e[i], x1)) / 2, l[i] + 1, pid,
+                color=text_contrast(col), ha="center", va="center", clip_on=True))
+
+        ticks = np.unique(np.r_[s, e]) if sparse else np.empty(0)
+        ticks = ticks[(ticks >= x0) & (ticks <= x1)]
+        if 0 < len(ticks) and (len(ticks) < 2 or np.diff(ticks).min() * ppu >= self.TICK_PX):
+            ax.set_xticks(ticks)
+        else:
+            ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", integer=True))
+        ax.set_xlim(x0, x1)   # set_xticks may widen the view; keep the user's window
+
+
+# ---------------- playback ----------------
+class PlaybackCursor:
+    """
+    Animated overlay for stepping through a Gantt list on an already drawn
+    chart: a highlight box on the current segment, a time line and a caption.
+    show(i) blits just these artists over a cached background, which is
+    recaptured after every full draw (zoom, pan, resize).
+    """
+    def __init__(self, ax, gantt, ymap):
+        self.ax = ax
+        self.gantt = gantt
+        self.ymap = ymap
+        self.index = None
+        self._bg = None
+        self.box = Rectangle((0, 0), 0, 0.8, fill=False, edgecolor="red",
+                             linewidth=2.5, animated=True)
+        ax.add_patch(self.box)
+        self.line = ax.axvline(0, color="red", linewidth=1, animated=True)
+        self.caption = ax.text(0.005, 0.97, "", transform=ax.transAxes, va="top",
+                               animated=True, bbox=dict(facecolor="white", alpha=0.8, lw=0))
+        self._artists = (self.box, self.line, self.caption)
+        for a in self._artists: a.set_visible(False)
+        self._cid = ax.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        # savefig may draw through a temporary non-blitting canvas
+        if event.canvas is not self.ax.figure.canvas or not event.canvas.supports_blit:
+            return
+        self._bg = event.canvas.copy_from_bbox(self.ax.bbox)
+        for a in self._artists: self.ax.draw_artist(a)
+
+    def show(self, i):
+        pid, s, e = self.gantt[i]
+        y = self.ymap[pid]
+        self.index = i
+        self.box.set_bounds(s, y - 0.4, e - s, 0.8)
+        self.line.set_xdata([e, e])
+        self.caption.set_text(f"{pid}  {s}-{e}   ({i+1}/{len(self.gantt)})")
+        for a in self._artists: a.set_visible(True)
+        canvas = self.ax.figure.canvas
+        if self._bg is None:
+            canvas.draw_idle()      # the draw_event will paint us
+            return
+        canvas.restore_region(self._bg)
+        for a in self._artists: self.ax.draw_artist(a)
+        canvas.blit(self.ax.bbox)
+
+    def hide(self):
+        for a in self._artists: a.set_visible(False)
+        if self._bg is not None:
+            canvas = self.ax.figure.canvas
+            canvas.restore_region(self._bg)
+            canvas.blit(self.ax.bbox)
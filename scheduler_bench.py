@@ -0,0 +1,140 @@
+# scheduler_bench.py
+# Benchmarks every scheduler over seeded workloads of several sizes and burst shapes.
+#   python scheduler_bench.py -o bench.json
+#   python scheduler_bench.py --sizes 100,1000 -a round_robin --compare bench.json
+# Output is JSON: run metadata plus one record per (algorithm, shape, size).
+import argparse, json, platform, random, sys, time, tracemalloc
+import scheduler_core as core
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+
+def _short(rng): return rng.randint(1, 5)
+def _long(rng): return rng.randint(100, 1000)
+def _heavy(rng): return min(int(rng.paretovariate(1.2)), 100000)
+
+# shape -> (burst sampler, mean burst used to spread arrivals)
+SHAPES = {"short": (_short, 3), "long": (_long, 550), "heavy": (_heavy, 6)}
+
+def bench_workload(n, shape, seed=0):
+    """n seeded processes; arrivals spread so the CPU stays close to fully loaded."""
+    rng = random.Random(seed)
+    burst, mean = SHAPES[shape]
+    span = n * mean
+    return [[f"P{i+1}", rng.randint(0, span), burst(rng), rng.randint(1, 10)]
+            for i in range(n)]
+
+def bench_case(algorithm, procs, quantum=2, memory=True):
+    """
+    Time one run. Scheduling time is the run minus a separate timed
+    _compute_stats_from_gantt pass over the same Gantt (the schedulers call it
+    internally). Peak memory comes from a second, tracemalloc-traced run.
+    """
+    t = time.perf_counter()
+    gantt, _ = core.run_algorithm(algorithm, procs, quantum)
+    total = time.perf_counter() - t
+    t = time.perf_counter()
+    core._compute_stats_from_gantt(gantt, procs)
+    stats_s = time.perf_counter() - t
+    rec = {"schedule_s": max(total - stats_s, 0.0), "stats_s": stats_s,
+           "total_s": total, "segments": len(gantt)}
+    del gantt
+    if memory:
+        tracemalloc.start()
+        core.run_algorithm(algorithm, procs, quantum)
+        rec["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return rec
+
+def run_bench(algorithms, sizes, shapes, quantum=2, seed=0, memory=True, budget=60.0, log=None):
+    """
+    Yield one record per case, smallest sizes first. Once a case exceeds
+    `budget` seconds, larger sizes of the same (algorithm, shape) are recorded
+    as skipped instead of run (LRTF on long bursts grows with total burst).
+    """
+    slow = set()
+    for shape in shapes:
+        for n in sizes:
+            procs = bench_workload(n, shape, seed)
+            for a in algorithms:
+                rec = {"algorithm": a, "shape": shape, "n": n,
+                       "quantum": quantum if a in core.QUANTUM_ALGORITHMS else None}
+                if (a, shape) in slow:
+                    rec["skipped"] = True
+                else:
+                    rec.update(bench_case(a, procs, quantum, memory))
+                    if rec["total_s"] > budget:
+                        slow.add((a, shape))
+                if log:
+                    log(rec)
+                yield rec
+
+def compare(old, new, threshold=1.2, min_s=0.01):
+    """
+    Rows (key, old_s, new_s, ratio, slower) for cases present in both runs.
+    slower = ratio above threshold on a case that takes at least min_s.
+    """
+    key = lambda r: (r["algorithm"], r["shape"], r["n"], r["quantum"])
+    before = {key(r): r for r in old["results"] if not r.get("skipped")}
+    rows = []
+    for r in new["results"]:
+        o = before.get(key(r))
+        if o is None or r.get("skipped"):
+            continue
+        ratio = r["total_s"] / o["total_s"] if o["total_s"] else float("inf")
+        rows.append((key(r), o["total_s"], r["total_s"], ratio,
+                     ratio > threshold and r["total_s"] >= min_s))
+    return rows
+
+def _ints(text): return [int(float(x)) for x in text.split(",")]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the CPU schedulers.")
+    ap.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                    choices=sorted(core.ALGORITHMS), help="repeatable, default: all")
+    ap.add_argument("--sizes", type=_ints, default=SIZES, help="comma list, e.g. 1e2,1e4")
+    ap.add_argument("--shapes", default=",".join(SHAPES), help="comma list of " + ",".join(SHAPES))
+    ap.add_argument("-q", "--quantum", type=int, default=2)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--budget", type=float, default=60.0,
+                    help="seconds; slower cases stop larger sizes of the same algorithm/shape")
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("-o", "--output", help="write results JSON here")
+    ap.add_argument("--compare", help="earlier results JSON to compare against")
+    args = ap.parse_args(argv)
+    shapes = args.shapes.split(",")
+    for s in shapes:
+        if s not in SHAPES:
+            ap.error(f"unknown shape {s!r}")
+
+    def log(r):
+        if r.get("skipped"):
+            print(f"{r['algorithm']:24}{r['shape']:7}{r['n']:>9}  skipped", file=sys.stderr)
+        else:
+            print(f"{r['algorithm']:24}{r['shape']:7}{r['n']:>9}  sched {r['schedule_s']:.3f}s"
+                  f"  stats {r['stats_s']:.3f}s  segs {r['segments']}"
+                  + (f"  peak {r['peak_bytes']/2**20:.1f}MiB" if "peak_bytes" in r else ""),
+                  file=sys.stderr)
+
+    results = list(run_bench(args.algorithms or list(core.ALGORITHMS), args.sizes, shapes,
+                             args.quantum, args.seed, not args.no_memory, args.budget, log))
+    doc = {"python": platform.python_version(), "platform": platform.platform(),
+           "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed,
+           "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(doc, f, indent=1)
+    else:
+        json.dump(doc, sys.stdout, indent=1); print()
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        slower = 0
+        for key, o, n, ratio, flag in compare(old, doc):
+            slower += flag
+            print(f"{'SLOWER ' if flag else '       '}{key}  {o:.3f}s -> {n:.3f}s  x{ratio:.2f}",
+                  file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
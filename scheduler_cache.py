@@ -0,0 +1,137 @@
+# scheduler_cache.py
+# Memoized scheduling results keyed by (workload fingerprint, algorithm, quantum):
+# an in-memory LRU in front of an optional on-disk store with size-based eviction.
+# Standard library only.
+import hashlib, os, pickle, threading
+from collections import OrderedDict
+import scheduler_core as core
+
+QUANTUM_ALGORITHMS = core.QUANTUM_ALGORITHMS   # the only ones whose result depends on the quantum
+
+def workload_fingerprint(processes):
+    """
+    Stable hex digest of a process list. Row order is part of it, since ties
+    are broken by input order.
+    """
+    h = hashlib.sha256()
+    for pid, at, bt, pr in processes:
+        h.update(f"{pid}\x1f{int(at)}\x1f{int(bt)}\x1f{int(pr)}\x1e".encode())
+    return h.hexdigest()
+
+def cache_key(fingerprint, name, quantum):
+    q = quantum if name in QUANTUM_ALGORITHMS else None
+    return f"{fingerprint}-{name}-{q}"
+
+class ResultCache:
+    """
+    get/put (gantt, stats) results. `maxsize` results stay in memory; with a
+    `path` they are also pickled there, and the oldest files are removed once
+    the directory holds more than `max_bytes`. Several processes may share a
+    directory. Cached results are shared objects - treat them as read-only.
+    """
+    def __init__(self, maxsize=32, path=None, max_bytes=512 * 2**20):
+        self.maxsize = maxsize
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._mem = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        if path:
+            os.makedirs(path, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._files())
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + ".pkl")
+
+    def _files(self):
+        out = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".pkl"):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue            # removed by another process
+                out.append((st.st_mtime, st.st_size, entry.path))
+        return out
+
+    def get(self, key):
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return self._mem[key]
+        value = self._load(key) if self.path else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        if self.path:
+            self._store(key, value)
+
+    def _remember(self, key, value):
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+
+    def _load(self, key):
+        f = self._file(key)
+        try:
+            with open(f, "rb") as fh:
+                value = pickle.load(fh)
+            os.utime(f)                 # mark recently used for eviction
+            return value
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _store(self, key, value):
+        f = self._file(key)
+        tmp = f"{f}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, f)              # readers never see a partial file
+        with self._lock:
+            self._disk_bytes += os.path.getsize(f)
+            if self._disk_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, f in files:
+            if total <= self.max_bytes * 0.8:
+                break
+            try:
+                os.remove(f)
+            except OSError:
+                pass
+            total -= size
+        self._disk_bytes = total
+
+    def clear(self):
+        with self._lock:
+            self._mem.clear()
+            if self.path:
+                for _, _, f in self._files():
+                    try:
+                        os.remove(f)
+                    except OSError:
+                        pass
+                self._disk_bytes = 0
+
+    def run(self, name, processes, quantum=2, fingerprint=None):
+        """run_algorithm through the cache; pass `fingerprint` if already known."""
+        key = cache_key(fingerprint or workload_fingerprint(processes), name, quantum)
+        value = self.get(key)
+        if value is None:
+            value = core.run_algorithm(name, processes, quantum)
+            self.put(key, value)
+        return value
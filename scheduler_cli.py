@@ -0,0 +1,182 @@
+# scheduler_cli.py
+# Headless batch runner:
+#   python scheduler_cli.py workload.csv -a fcfs -a round_robin -q 2 -q 4 -o stats.json
+import time
+_T0 = time.perf_counter()
+import argparse, csv, json, sys
+import scheduler_core as core
+from scheduler_cache import ResultCache, workload_fingerprint
+from scheduler_smp import smp_schedule, SMP_ALGORITHMS, QUEUES
+_IMPORT_S = time.perf_counter() - _T0
+
+STAT_FIELDS = ["pid", "arrival", "burst", "priority", "ct", "tat", "wt", "rt"]
+
+def run_batch(processes, algorithms, quanta, cache=None, cpus=1, queues="global", steal=True,
+              metrics=False, profiler=None):
+    """
+    One result dict per (algorithm, quantum); quanta only expand
+    core.QUANTUM_ALGORITHMS (round_robin, mlfq).
+    With a scheduler_cache.ResultCache, unchanged runs are not recomputed.
+    cpus > 1 runs scheduler_smp instead: the gantt is then one list per core
+    and each result also carries makespan, utilization, migrations and
+    preemptions. Single-CPU runs get core.EngineMetrics counters under
+    "metrics" with metrics=True, and `profiler` is enabled around each
+    dispatch loop.
+    """
+    results = []
+    fp = workload_fingerprint(processes) if cache is not None and cpus == 1 else None
+    for name in algorithms:
+        for q in (quanta if name in core.QUANTUM_ALGORITHMS else [None]):
+            if cpus > 1:
+                gantt, done, info = smp_schedule(name, processes, cpus, q, queues, steal)
+                res = {"algorithm": name, "quantum": q, "cpus": cpus, "queues": queues,
+                       "summary": core.aggregate_stats(done)}
+                for k in ("makespan", "utilization", "migrations", "preemptions"):
+                    res[k] = info[k]
+                res["stats"] = [dict(zip(STAT_FIELDS, row)) for row in done]
+                res["gantt"] = gantt
+                results.append(res)
+                continue
+            m = None
+            if metrics or profiler is not None:
+                m = core.EngineMetrics(profiler=profiler)
+                gantt, done = core.simulate(name, processes, q, metrics=m)
+            elif cache is not None:
+                gantt, done = cache.run(name, processes, q, fp)
+            else:
+                gantt, done = core.run_algorithm(name, processes, q)
+            res = {
+                "algorithm": name,
+                "quantum": q,
+                "summary": core.aggregate_stats(done),
+                "stats": [dict(zip(STAT_FIELDS, row)) for row in done],
+                "gantt": gantt,
+            }
+            if metrics:
+                res["metrics"] = m.summary()
+            results.append(res)
+    return results
+
+def write_results(results, out, fmt, with_gantt=False):
+    if fmt == "json":
+        if not with_gantt:
+            results = [{k: v for k, v in r.items() if k != "gantt"} for r in results]
+        json.dump(results, out, indent=2, default=list)   # SegmentStore -> [[pid, s, e], ...]
+        out.write("\n")
+        return
+    w = csv.writer(out)
+    w.writerow(["algorithm", "quantum"] + STAT_FIELDS)
+    for r in results:
+        q = "" if r["quantum"] is None else r["quantum"]
+        for row in r["stats"]:
+            w.writerow([r["algorithm"], q] + [row[k] for k in STAT_FIELDS])
+
+def write_stream(events, out):
+    """JSON Lines, one object per segment / finished process, in the order produced."""
+    for kind, x in events:
+        if kind == "segment":
+            rec = {"type": "segment", "pid": x[0], "start": x[1], "end": x[2]}
+        else:
+            rec = dict(zip(STAT_FIELDS, x), type="stats")
+        out.write(json.dumps(rec) + "\n")
+
+def build_parser():
+    ap = argparse.ArgumentParser(description="Run CPU scheduling algorithms without the GUI.")
+    ap.add_argument("workload", help="workload file (.csv, .json or .jsonl)")
+    ap.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                    choices=sorted(core.ALGORITHMS) + ["all"],
+                    help="algorithm to run (repeatable, default: all)")
+    ap.add_argument("-q", "--quantum", action="append", type=int, dest="quanta",
+                    help="Round Robin quantum, MLFQ top-level quantum (repeatable, default: 2)")
+    ap.add_argument("-o", "--output", help="output file (default: stdout)")
+    ap.add_argument("-f", "--format", choices=["json", "csv"],
+                    help="output format (default: from --output extension, else json)")
+    ap.add_argument("--gantt", action="store_true", help="include Gantt segments in JSON output")
+    ap.add_argument("--stream", action="store_true",
+                    help="read the workload lazily (must be sorted by arrival) and write "
+                         "segments and per-process stats as JSON Lines while scheduling; "
+                         "one algorithm only")
+    ap.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR from earlier runs")
+    ap.add_argument("--cpus", type=int, default=1,
+                    help="simulate this many cores (default 1; 'all' then means every "
+                         "algorithm with a multi-CPU version: " + ", ".join(SMP_ALGORITHMS) + ")")
+    ap.add_argument("--queues", choices=QUEUES, default="global",
+                    help="with --cpus: one shared ready queue or one per core")
+    ap.add_argument("--no-steal", action="store_true",
+                    help="with --queues per_core: idle cores do not take other cores' work")
+    ap.add_argument("--metrics", action="store_true",
+                    help="add engine counters (context switches, idle time, throughput, "
+                         "ready-queue length, decision time) to JSON output; single CPU")
+    ap.add_argument("--profile", action="store_true",
+                    help="profile the dispatch loops and print the top functions to stderr")
+    ap.add_argument("--timing", action="store_true", help="print import and run time to stderr")
+    return ap
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    algorithms = args.algorithms or ["all"]
+    if "all" in algorithms:
+        algorithms = list(core.ALGORITHMS if args.cpus == 1 else SMP_ALGORITHMS)
+    if args.cpus < 1:
+        print("error: --cpus must be at least 1", file=sys.stderr)
+        return 2
+    if args.cpus > 1 and (args.stream or set(algorithms) - set(SMP_ALGORITHMS)):
+        print("error: --cpus above 1 works with " + ", ".join(SMP_ALGORITHMS) + ", without --stream",
+              file=sys.stderr)
+        return 2
+    fmt = args.format or ("csv" if (args.output or "").lower().endswith(".csv") else "json")
+
+    if args.stream:
+        if len(algorithms) != 1:
+            print("error: --stream runs exactly one algorithm", file=sys.stderr)
+            return 2
+        return _main_stream(args, algorithms[0])
+
+    t = time.perf_counter()
+    try:
+        processes = core.load_workload(args.workload)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    cache = ResultCache(path=args.cache) if args.cache else None
+    profiler = None
+    if args.profile:
+        import cProfile      # only when asked: keeps CLI start-up lean
+        profiler = cProfile.Profile()
+    results = run_batch(processes, algorithms, args.quanta or [2], cache,
+                        args.cpus, args.queues, not args.no_steal, args.metrics, profiler)
+    run_s = time.perf_counter() - t
+
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            write_results(results, out, fmt, args.gantt)
+    else:
+        write_results(results, sys.stdout, fmt, args.gantt)
+    if profiler is not None:
+        import pstats
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+    if args.timing:
+        print(f"import {_IMPORT_S*1000:.1f} ms, load+run {run_s*1000:.1f} ms, "
+              f"total {(time.perf_counter()-_T0)*1000:.1f} ms", file=sys.stderr)
+    return 0
+
+def _main_stream(args, algorithm):
+    t = time.perf_counter()
+    events = core.stream_schedule(algorithm, core.iter_workload(args.workload),
+                                  (args.quanta or [2])[0])
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        write_stream(events, out)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.timing:
+        print(f"import {_IMPORT_S*1000:.1f} ms, stream {(time.perf_counter()-t)*1000:.1f} ms",
+              file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
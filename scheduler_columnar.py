@@ -0,0 +1,161 @@
+# scheduler_columnar.py
+# Columnar workloads for large traces: NumPy arrays instead of per-process lists.
+# Optional - needs numpy; scheduler_core works without it.
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+import gc
+from operator import itemgetter
+from scheduler_core import _percentile, _compute_stats_from_gantt, SegmentStore
+
+
+class Workload:
+    """
+    Processes stored as columns: arrival, burst, priority (int64 arrays) and
+    pid (int32 index into names, so each PID string is stored once).
+    names=None means synthetic PIDs "P1", "P2", ... built on demand.
+
+    Indexing and iteration yield (pid, arrival, burst, priority) rows, so every
+    scheduler in scheduler_core accepts a Workload directly; by_arrival()
+    hands them an arrival-sorted view instead of a sorted list copy.
+    """
+    def __init__(self, arrival, burst, priority=None, pid=None, names=None):
+        if not _HAS_NUMPY:
+            raise ImportError("Workload needs numpy (pip install numpy)")
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        n = len(self.arrival)
+        self.priority = (np.zeros(n, dtype=np.int64) if priority is None
+                         else np.asarray(priority, dtype=np.int64))
+        self.pid = (np.arange(n, dtype=np.int32) if pid is None
+                    else np.asarray(pid, dtype=np.int32))
+        self.names = names
+        self._sorted = None
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Build from [pid, arrival, burst, priority] rows, interning PIDs."""
+        index = {}
+        pid = [index.setdefault(p[0], len(index)) for p in processes]
+        return cls([p[1] for p in processes], [p[2] for p in processes],
+                   [p[3] for p in processes], pid, list(index))
+
+    def name(self, i):
+        """PID string of pid index i."""
+        return f"P{i+1}" if self.names is None else self.names[i]
+
+    def labels(self, idx):
+        """PID strings of a list of pid indices."""
+        if self.names is None:
+            return [f"P{i+1}" for i in idx]
+        return list(map(self.names.__getitem__, idx))
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __getitem__(self, i):
+        return (self.name(int(self.pid[i])), int(self.arrival[i]),
+                int(self.burst[i]), int(self.priority[i]))
+
+    def __iter__(self):
+        name = self.name
+        for k, a, b, p in zip(self.pid.tolist(), self.arrival.tolist(),
+                              self.burst.tolist(), self.priority.tolist()):
+            yield (name(k), a, b, p)
+
+    def take(self, order):
+        return Workload(self.arrival[order], self.burst[order],
+                        self.priority[order], self.pid[order], self.names)
+
+    def arrival_order(self):
+        # stable, so equal arrivals keep input order like sorted() does
+        return np.argsort(self.arrival, kind="stable")
+
+    def by_arrival(self):
+        if self._sorted is None:
+            if len(self) < 2 or bool(np.all(self.arrival[1:] >= self.arrival[:-1])):
+                self._sorted = self
+            else:
+                self._sorted = self.take(self.arrival_order())
+                self._sorted._sorted = self._sorted
+        return self._sorted
+
+    def fcfs(self):
+        # scheduler_core.fcfs hands columnar workloads to the vectorized path
+        return fcfs_schedule(self)
+
+    def nbytes(self):
+        return (self.arrival.nbytes + self.burst.nbytes
+                + self.priority.nbytes + self.pid.nbytes)
+
+
+# ---------------- vectorized FCFS + metrics ----------------
+def fcfs_columnar(w):
+    """
+    FCFS with no per-process Python loop. Returns (order, start, completion):
+    order is the dispatch order (row indices of w), start/completion are
+    aligned with w's rows. Same schedule as scheduler_core.fcfs.
+    """
+    order = w.arrival_order()
+    a = w.arrival[order]
+    b = w.burst[order]
+    done_before = np.cumsum(b) - b          # work dispatched before job i
+    # completion_i = max(completion_{i-1}, a_i) + b_i, unrolled:
+    # idle shift = running max of (a_j - work before j), clamped at time 0
+    shift = np.maximum(np.maximum.accumulate(a - done_before), 0)
+    start = np.empty_like(a); completion = np.empty_like(a)
+    start[order] = done_before + shift
+    completion[order] = done_before + shift + b
+    return order, start, completion
+
+def metrics_columnar(w, first_start, completion):
+    """TAT, WT, RT arrays aligned with w's rows."""
+    tat = completion - w.arrival
+    return tat, tat - w.burst, first_start - w.arrival
+
+def aggregate_columnar(tat, wt, rt):
+    """Same keys and nearest-rank percentiles as scheduler_core.aggregate_stats."""
+    out = {"n": int(len(tat))}
+    if not len(tat):
+        return out
+    for name, vals in (("tat", tat), ("wt", wt), ("rt", rt)):
+        vals = np.sort(vals)
+        out["avg_"+name] = float(vals.mean())
+        for q in (50, 90, 99):
+            out[f"p{q}_{name}"] = int(_percentile(vals, q))
+        out["max_"+name] = int(vals[-1])
+    return out
+
+def fcfs_gantt(w, order, start, completion):
+    """Columnar FCFS result as scheduler_core's Gantt list (a SegmentStore)."""
+    used, lane = np.unique(w.pid[order], return_inverse=True)
+    # lanes must be numbered by first appearance, like SegmentStore.append
+    first = np.full(len(used), len(lane)); np.minimum.at(first, lane, np.arange(len(lane)))
+    rank = np.empty(len(used), dtype=np.int64); rank[np.argsort(first)] = np.arange(len(used))
+    return SegmentStore.from_arrays(w.labels(used[np.argsort(first)].tolist()),
+                                    rank[lane], start[order], completion[order])
+
+def fcfs_schedule(w):
+    """
+    scheduler_core.fcfs(w) without the per-process loop: the same (gantt,
+    stats) from fcfs_columnar, fcfs_gantt and metrics_columnar.
+    """
+    order, start, completion = fcfs_columnar(w)
+    gantt = fcfs_gantt(w, order, start, completion)
+    if len(gantt.pids) < len(w):
+        # repeated PIDs share one stats row, as _compute_stats_from_gantt merges them
+        return gantt, _compute_stats_from_gantt(gantt, w)
+    tat, wt, rt = metrics_columnar(w, start, completion)
+    # unique PIDs: one segment each, so gantt.pids names the rows in dispatch order
+    cols = [gantt.pids] + [c[order].tolist() for c in (w.arrival, w.burst, w.priority,
+                                                        completion, tat, wt, rt)]
+    enabled = gc.isenabled(); gc.disable()    # a million new lists, nothing cyclic
+    try:
+        stats = list(map(list, zip(*cols)))
+    finally:
+        if enabled: gc.enable()
+    stats.sort(key=itemgetter(0))
+    return gantt, stats
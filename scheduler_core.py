@@ -0,0 +1,977 @@
+# scheduler_core.py
+# Headless scheduling core: algorithms, stats and workload loading.
+# Standard library only - nothing here may import tkinter or matplotlib.
+import csv, json, heapq, random, time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+# ---------------- Gantt storage ----------------
+class SegmentStore:
+    """
+    Gantt list kept as three typed arrays - pid (int32 index into `pids`,
+    each PID stored once), start and end (int64) - about 20 bytes a segment
+    instead of a tuple per segment. Reads like the list of (pid, start, end)
+    tuples the schedulers used to return; append() adds a segment and
+    extend_last() moves the end of the last one in place. The arrays support
+    the buffer protocol, so as_numpy() views them without copying.
+    """
+    __slots__ = ("pids", "index", "pid", "start", "end")
+
+    def __init__(self, segments=()):
+        self.pids = []; self.index = {}
+        self.pid = array("i"); self.start = array("q"); self.end = array("q")
+        for seg in segments:
+            self.append(*seg)
+
+    @classmethod
+    def from_arrays(cls, pids, pid, start, end):
+        """Build from PID names and index/start/end columns (lists, arrays or memoryviews)."""
+        g = cls()
+        g.pids = list(pids); g.index = dict(zip(g.pids, range(len(g.pids))))
+        for col, vals in ((g.pid, pid), (g.start, start), (g.end, end)):
+            if hasattr(vals, "astype"):      # numpy: copy the raw column once
+                col.frombytes(vals.astype("int32" if col.typecode == "i" else "int64").tobytes())
+            elif isinstance(vals, memoryview):  # mapped column, already in this layout
+                col.frombytes(vals.cast("B"))
+            else:
+                col.extend(vals)
+        return g
+
+    @classmethod
+    def wrap(cls, pids, pid, start, end):
+        """
+        Read-only store over existing columns - anything indexable with the
+        buffer protocol, e.g. memoryviews of a mapped file. Nothing is copied.
+        """
+        g = cls()
+        g.pids, g.pid, g.start, g.end = pids, pid, start, end
+        g.index = None
+        return g
+
+    def intern(self, pid):
+        i = self.index.get(pid)
+        if i is None:
+            i = self.index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return i
+
+    def append(self, pid, start, end):
+        self.pid.append(self.intern(pid)); self.start.append(start); self.end.append(end)
+
+    def extend_last(self, end):
+        self.end[-1] = end
+
+    def emit(self, pid, start, end):
+        """append(), or extend the last segment if it is pid's and ends at start."""
+        if self.end and self.end[-1] == start and self.pids[self.pid[-1]] == pid:
+            self.end[-1] = end
+        else:
+            self.append(pid, start, end)
+
+    def truncate(self, n, last_end=None):
+        """Keep the first n segments; last_end resets the end of the new last one."""
+        del self.pid[n:]; del self.start[n:]; del self.end[n:]
+        if n and last_end is not None:
+            self.end[-1] = last_end
+
+    def copy(self):
+        g = SegmentStore()
+        g.pids = list(self.pids); g.index = dict(self.index)
+        g.pid, g.start, g.end = array("i", self.pid), array("q", self.start), array("q", self.end)
+        return g
+
+    def __reduce__(self):
+        # a wrap()ped store holds memoryviews, which cannot be pickled: copy
+        # its columns into arrays first
+        g = self if self.index is not None else SegmentStore.from_arrays(self.pids, self.pid, self.start, self.end)
+        return (SegmentStore.from_arrays, (g.pids, g.pid, g.start, g.end))
+
+    def __len__(self):
+        return len(self.start)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return (self.pids[self.pid[i]], self.start[i], self.end[i])
+
+    def __iter__(self):
+        pids = self.pids
+        for k, s, e in zip(self.pid, self.start, self.end):
+            yield (pids[k], s, e)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SegmentStore({len(self)} segments, {len(self.pids)} pids)"
+
+    def nbytes(self):
+        return sum(len(a) * a.itemsize for a in (self.pid, self.start, self.end))
+
+    def as_numpy(self):
+        """(pid index, start, end) as NumPy arrays sharing this store's memory."""
+        import numpy as np
+        return (np.frombuffer(self.pid, dtype=np.int32),
+                np.frombuffer(self.start, dtype=np.int64),
+                np.frombuffer(self.end, dtype=np.int64))
+
+# ---------------- compute stats ----------------
+class StatsAccumulator:
+    """
+    Streaming form of _compute_stats_from_gantt: feed segments with add()
+    as they are emitted (extending the last one is fine), then call rows().
+    make_row() builds one row; every path that reports stats goes through it.
+    """
+    def __init__(self, processes):
+        self.proc_map = {p[0]: p for p in processes}
+        self.first = {}
+        self.completion = {}
+
+    def add(self, pid, start, end):
+        if pid not in self.first:
+            self.first[pid] = start
+        c = self.completion.get(pid)
+        if c is None or end > c:
+            self.completion[pid] = end
+
+    @staticmethod
+    def make_row(p, completion, first):
+        """Row of process p = [pid, arrival, burst, priority] given its completion and first start."""
+        tat = completion - p[1]
+        return [p[0], p[1], p[2], p[3], completion, tat, tat - p[2], first - p[1]]
+
+    def row(self, pid):
+        return self.make_row(self.proc_map[pid], self.completion[pid], self.first[pid])
+
+    def rows(self):
+        done = [self.row(pid) for pid in self.proc_map if pid in self.first]
+        done.sort(key=lambda x: x[0])
+        return done
+
+def _compute_stats_from_gantt(gantt, processes):
+    """
+    [pid, arrival, burst, priority, completion, TAT, WT, RT]
+    """
+    acc = StatsAccumulator(processes)
+    if isinstance(gantt, SegmentStore):
+        # per PID index straight from the arrays - no tuple per segment
+        n = len(gantt.pids)
+        first = [None] * n; completion = [None] * n
+        for k, s, e in zip(gantt.pid, gantt.start, gantt.end):
+            if first[k] is None: first[k] = s
+            c = completion[k]
+            if c is None or e > c: completion[k] = e
+        for pid, f, c in zip(gantt.pids, first, completion):
+            if f is not None:   # a mapped store's PID table may list idle PIDs
+                acc.first[pid] = f; acc.completion[pid] = c
+        return acc.rows()
+    add = acc.add
+    for pid, s, e in gantt:
+        add(pid, s, e)
+    return acc.rows()
+
+def _percentile(sorted_vals, q):
+    # nearest-rank
+    k = max(0, -(-len(sorted_vals) * q // 100) - 1)
+    return sorted_vals[int(k)]
+
+def aggregate_stats(done):
+    """
+    Summary of the rows from _compute_stats_from_gantt:
+    avg / p50 / p90 / p99 / max for TAT, WT and RT, plus process count n.
+    """
+    out = {"n": len(done)}
+    if not done:
+        return out
+    for name, col in (("tat", 5), ("wt", 6), ("rt", 7)):
+        vals = sorted(p[col] for p in done)
+        out["avg_"+name] = sum(vals) / len(vals)
+        for q in (50, 90, 99):
+            out[f"p{q}_{name}"] = _percentile(vals, q)
+        out["max_"+name] = vals[-1]
+    return out
+
+# ---------------- scheduling algorithms ----------------
+def _by_arrival(processes):
+    # columnar workloads (scheduler_columnar.Workload) supply their own
+    # arrival-ordered view instead of being copied into row lists
+    if hasattr(processes, "by_arrival"):
+        return processes.by_arrival()
+    return sorted(processes, key=lambda x: x[1])
+
+# Step generators: each core walks an iterable of processes sorted by arrival
+# and yields (k, p, start, end, done) per dispatch, k being the process's
+# admission ordinal and done whether it finished at `end`. Only admitted,
+# unfinished processes are held, so the cores also serve stream_schedule.
+#
+# With a `ckpt` callback a core reports its state every _CKPT_EVERY
+# dispatches (or every 2x ready-queue length, if longer) as
+# ckpt(pos, horizon, state): procs[:pos] have been admitted and no other
+# arrival is <= horizon (None: later arrivals never matter). Passing `state`
+# back, with the same procs[:pos], resumes the run there - see
+# IncrementalSchedule.
+_CKPT_EVERY = 1024
+
+def _resume(procs, pos):
+    it = islice(procs, pos, None) if pos else iter(procs)
+    return it, next(it, None)
+
+def _fcfs_steps(procs, ckpt=None, state=None):
+    time, k0 = state or (0, 0)
+    for k, p in enumerate(islice(procs, k0, None) if k0 else procs, k0):
+        if ckpt is not None and k > k0 and (k - k0) % _CKPT_EVERY == 0:
+            ckpt(k, None, (time, k))
+        if time < p[1]: time = p[1]
+        start = time
+        time += p[2]
+        yield k, p, start, time, True
+
+def _nonpreemptive_steps(procs, key, ckpt=None, state=None):
+    """
+    Shared core for the non-preemptive schedulers.
+    key(p) orders the ready heap, smallest dispatched first. Ties go to the
+    job that comes first by arrival, then by input order.
+    """
+    time, k, heap = (state[0], state[1], list(state[2])) if state else (0, 0, [])
+    it, nxt = _resume(procs, k)
+    due = _CKPT_EVERY
+    while nxt is not None or heap:
+        while nxt is not None and nxt[1] <= time:
+            heapq.heappush(heap, (key(nxt), k, nxt)); k += 1
+            nxt = next(it, None)
+        if ckpt is not None:
+            due -= 1
+            if due <= 0:
+                due = max(_CKPT_EVERY, 2 * len(heap))
+                ckpt(k, time, (time, k, list(heap)))
+        if heap:
+            _, i, p = heapq.heappop(heap)
+            start = time
+            time += p[2]
+            yield i, p, start, time, True
+        else:
+            time = nxt[1]
+
+def _preemptive_steps(procs, key, horizon=None, ckpt=None, state=None):
+    """
+    Event-driven core shared by the preemptive schedulers.
+    key(p, rem) orders the ready heap (smallest runs). Time only jumps to the
+    next arrival, the next completion, or - if given - horizon(p, rem, top),
+    the number of ticks the running job keeps winning against heap top.
+    Ties go to the running job, then the most recently preempted one, then
+    arrival order, which is what the old per-tick stable re-sort did.
+    """
+    if state:   # heap entries and cur are mutated, so states hold copies
+        time, seq, back, heap, cur = state
+        heap = [(a, b, e[:]) for a, b, e in heap]; cur = cur and cur[:]
+    else:
+        heap = []
+        time = 0; seq = 0; back = 0; cur = None   # cur = [k, p, rem]
+    it, nxt = _resume(procs, seq)
+    due = _CKPT_EVERY
+    while True:
+        while nxt is not None and nxt[1] <= time:
+            if nxt[2] > 0:
+                heapq.heappush(heap, (key(nxt, nxt[2]), seq, [seq, nxt, nxt[2]]))
+            seq += 1
+            nxt = next(it, None)
+        if ckpt is not None:
+            due -= 1
+            if due <= 0:
+                due = max(_CKPT_EVERY, 2 * len(heap))
+                ckpt(seq, time, (time, seq, back, [(a, b, e[:]) for a, b, e in heap], cur and cur[:]))
+        if cur is None:
+            if not heap:
+                if nxt is None: return   # only zero-burst jobs were left
+                time = nxt[1]; continue
+            cur = heapq.heappop(heap)[2]
+        elif heap and heap[0][0] < key(cur[1], cur[2]):
+            back -= 1
+            cur = heapq.heappushpop(heap, (key(cur[1], cur[2]), back, cur))[2]
+        k, p, rem = cur
+        run = rem
+        if nxt is not None: run = min(run, nxt[1] - time)
+        if horizon and heap: run = min(run, horizon(p, rem, heap[0]))
+        cur[2] = rem - run
+        yield k, p, time, time + run, run == rem
+        time += run
+        if run == rem: cur = None
+
+def _round_robin_steps(procs, quantum, ckpt=None, state=None):
+    if quantum<=0: quantum=1
+    if state:
+        time, k, queue = state[0], state[1], deque(map(list.copy, state[2]))
+    else:
+        time=0; queue=deque(); k=0   # queue of [k, p, rem]
+    it, nxt = _resume(procs, k)
+    push=queue.append; pop=queue.popleft
+    due=_CKPT_EVERY
+    while True:
+        while nxt is not None and nxt[1]<=time:
+            push([k, nxt, nxt[2]]); k+=1; nxt=next(it, None)
+        if ckpt is not None:
+            due-=1
+            if due<=0:
+                due=max(_CKPT_EVERY, 2*len(queue))
+                ckpt(k, time, (time, k, list(map(list.copy, queue))))
+        if not queue:
+            if nxt is None: return
+            time=nxt[1]; continue
+        e=pop()
+        start=time
+        rem=e[2]
+        if rem>quantum:
+            time+=quantum; e[2]=rem-quantum
+        else:
+            time+=rem; e[2]=0
+        yield e[0], e[1], start, time, rem<=quantum
+        while nxt is not None and nxt[1]<=time:
+            push([k, nxt, nxt[2]]); k+=1; nxt=next(it, None)
+        if rem>quantum:
+            push(e)
+
+MLFQ_LEVELS = 3   # levels when the quanta come from a single quantum
+
+def _mlfq_quanta(quantum):
+    # one quantum from the batch paths / GUI: doubled on each level down
+    q = max(quantum, 1)
+    return tuple(q << i for i in range(MLFQ_LEVELS))
+
+def _mlfq_steps(procs, quanta, boost=None, ckpt=None, state=None):
+    """
+    Multilevel feedback queue in the manner of the Linux O(1) scheduler: a
+    FIFO per level plus a bitmap of the non-empty ones, so picking the next
+    job is a lowest-set-bit lookup however many are ready. Jobs enter level
+    0; one that has used up quanta[level] there (over any number of runs)
+    drops a level, and the last level is Round Robin. An arrival preempts a
+    job below level 0, which keeps its place at the head of its level.
+    Every `boost` ticks (default 8 slices of the last level, 0 for never)
+    all jobs go back to level 0: the queues are concatenated and allotments
+    reset lazily through an epoch stamp. A boost moves every job below level
+    0, which is O(ready jobs) - but each of them was demoted by a dispatch
+    since the last boost, so dispatch stays O(1) amortized over a period.
+    With a single level and no boost this is _round_robin_steps.
+    """
+    quanta = [max(int(x), 1) for x in quanta] or [1]
+    last = len(quanta) - 1
+    period = 8 * quanta[-1] if boost is None else boost
+    if state:
+        time, k, epoch, next_boost, levels = state
+        queues = [deque(map(list.copy, q)) for q in levels]
+    else:
+        time = 0; k = 0; epoch = 0
+        next_boost = period if period > 0 else None
+        queues = [deque() for _ in quanta]   # of [k, p, rem, used, epoch]
+    bits = 0
+    for i, q in enumerate(queues):
+        if q: bits |= 1 << i
+    top = queues[0]
+    it, nxt = _resume(procs, k)
+    due = _CKPT_EVERY
+    while True:
+        if next_boost is not None and time >= next_boost:
+            for q in queues[1:]:
+                if q: top.extend(q); q.clear()
+            bits = 1 if top else 0
+            epoch += 1
+            next_boost = (time // period + 1) * period
+        while nxt is not None and nxt[1] <= time:
+            top.append([k, nxt, nxt[2], 0, epoch]); k += 1; nxt = next(it, None)
+            bits |= 1
+        if ckpt is not None:
+            due -= 1
+            if due <= 0:
+                due = max(_CKPT_EVERY, 2 * sum(map(len, queues)))
+                ckpt(k, time, (time, k, epoch, next_boost, [list(map(list.copy, q)) for q in queues]))
+        if not bits:
+            if nxt is None: return
+            time = nxt[1]; continue
+        lvl = (bits & -bits).bit_length() - 1
+        q = queues[lvl]; e = q.popleft()
+        if not q: bits ^= 1 << lvl
+        if e[4] != epoch: e[3] = 0; e[4] = epoch
+        rem = e[2]; quantum = quanta[lvl]
+        run = min(rem, quantum - e[3])
+        if lvl and nxt is not None and nxt[1] - time < run: run = nxt[1] - time
+        if next_boost is not None and next_boost - time < run: run = next_boost - time
+        start = time; time += run
+        e[2] = rem - run; e[3] += run
+        yield e[0], e[1], start, time, run == rem
+        while nxt is not None and nxt[1] <= time:   # before a requeue, as in Round Robin
+            top.append([k, nxt, nxt[2], 0, epoch]); k += 1; nxt = next(it, None)
+            bits |= 1
+        if run == rem: continue
+        if e[3] >= quantum:
+            if lvl < last: lvl += 1
+            e[3] = 0; queues[lvl].append(e)
+        else:
+            q.appendleft(e)
+        bits |= 1 << lvl
+
+def _collect(steps, processes, merge=True):
+    # non-preemptive schedulers never merged back-to-back segments
+    gantt = SegmentStore()
+    index = gantt.index; pids = gantt.pids
+    lane = gantt.pid.append; st = gantt.start.append
+    ends = gantt.end; en = ends.append
+    last = None; end = None   # SegmentStore.emit, inlined for the hot loop
+    for _, p, s, e, _ in steps:
+        pid = p[0]
+        if merge and pid == last and s == end:
+            ends[-1] = e
+        else:
+            i = index.get(pid)
+            if i is None:
+                i = index[pid] = len(pids); pids.append(pid)
+            lane(i); st(s); en(e)
+            last = pid
+        end = e
+    return gantt, _compute_stats_from_gantt(gantt, processes)
+
+def _sjf_key(p): return p[2]
+def _ljf_key(p): return -p[2]
+def _priority_key(p): return p[3]
+def _srtf_key(p, r): return r
+def _priority_rem_key(p, r): return (p[3], r)
+def _lrtf_key(p, r): return (-r, p[1])
+
+def _lrtf_horizon(p, r, top):
+    # ticks until a waiting job with (-rem, arrival) = top[0] beats us
+    w_rem, w_at = -top[0][0], top[0][1]
+    return r - w_rem + (1 if p[1] <= w_at else 0)
+
+def fcfs(processes):
+    # columnar workloads (scheduler_columnar.Workload) schedule FCFS vectorized
+    if hasattr(processes, "fcfs"):
+        return processes.fcfs()
+    return _collect(_fcfs_steps(_by_arrival(processes)), processes, merge=False)
+
+def sjf_nonpreemptive(processes):
+    return _collect(_nonpreemptive_steps(_by_arrival(processes), _sjf_key), processes, merge=False)
+
+def sjf_preemptive(processes):
+    # SRTF
+    return _collect(_preemptive_steps(_by_arrival(processes), _srtf_key), processes)
+
+def ljf_nonpreemptive(processes):
+    # LONGEST JOB FIRST
+    return _collect(_nonpreemptive_steps(_by_arrival(processes), _ljf_key), processes, merge=False)
+
+def priority_nonpreemptive(processes):
+    return _collect(_nonpreemptive_steps(_by_arrival(processes), _priority_key), processes, merge=False)
+
+def priority_preemptive(processes):
+    return _collect(_preemptive_steps(_by_arrival(processes), _priority_rem_key), processes)
+
+def lrtf_preemptive(processes):
+    # Longest Remaining Time First
+    return _collect(_preemptive_steps(_by_arrival(processes), _lrtf_key, _lrtf_horizon), processes)
+
+def round_robin(processes, quantum):
+    return _collect(_round_robin_steps(_by_arrival(processes), quantum), processes)
+
+def mlfq(processes, quanta=(2, 4, 8), boost=None):
+    """
+    Multilevel feedback queue, one time slice per level in `quanta` (top
+    first); `boost` is the aging period in ticks - see _mlfq_steps.
+    """
+    return _collect(_mlfq_steps(_by_arrival(processes), quanta, boost), processes)
+
+def round_robin_sweep(processes, quanta):
+    """
+    Run Round Robin once per quantum, sorting by arrival only once.
+    Returns {quantum: (gantt, stats)}.
+    """
+    procs = _by_arrival(processes)
+    return {q: _collect(_round_robin_steps(procs, q), processes) for q in quanta}
+
+# ---------------- streaming ----------------
+# name -> (step generator factory(procs, quantum, ckpt=None, state=None),
+# merge back-to-back segments)
+_STEPS = {
+    "fcfs": (lambda procs, q, **kw: _fcfs_steps(procs, **kw), False),
+    "sjf_nonpreemptive": (lambda procs, q, **kw: _nonpreemptive_steps(procs, _sjf_key, **kw), False),
+    "sjf_preemptive": (lambda procs, q, **kw: _preemptive_steps(procs, _srtf_key, **kw), True),
+    "ljf_nonpreemptive": (lambda procs, q, **kw: _nonpreemptive_steps(procs, _ljf_key, **kw), False),
+    "priority_nonpreemptive": (lambda procs, q, **kw: _nonpreemptive_steps(procs, _priority_key, **kw), False),
+    "priority_preemptive": (lambda procs, q, **kw: _preemptive_steps(procs, _priority_rem_key, **kw), True),
+    "lrtf_preemptive": (lambda procs, q, **kw: _preemptive_steps(procs, _lrtf_key, _lrtf_horizon, **kw), True),
+    "round_robin": (lambda procs, q, **kw: _round_robin_steps(procs, q, **kw), True),
+    "mlfq": (lambda procs, q, **kw: _mlfq_steps(procs, _mlfq_quanta(q), **kw), True),
+}
+
+def _checked(processes):
+    last = None
+    for p in processes:
+        if last is not None and p[1] < last:
+            raise ValueError(f"process {p[0]!r} arrives at {p[1]}, before {last}: "
+                             "streamed input must be sorted by arrival")
+        last = p[1]
+        yield p
+
+def stream_schedule(name, processes, quantum=2):
+    """
+    Streaming form of run_algorithm for traces too big to hold in memory.
+    processes: any iterable of [pid, arrival, burst, priority] sorted by
+    arrival (ValueError otherwise), e.g. iter_workload(path). Yields
+    ("segment", (pid, start, end)) once a Gantt segment can no longer grow and
+    ("stats", row) - the _compute_stats_from_gantt row - as soon as a process
+    completes. Memory is bounded by the ready queue, not the trace length.
+    """
+    if name not in _STEPS:
+        raise ValueError(f"unknown algorithm {name!r}")
+    factory, merge = _STEPS[name]
+    first = {}; seg = None; row = StatsAccumulator.make_row
+    for k, p, s, e, done in factory(_checked(processes), quantum):
+        pid = p[0]
+        if seg is None:
+            seg = (pid, s, e)
+        elif merge and seg[0] == pid and seg[2] == s:
+            seg = (pid, seg[1], e)
+        else:
+            yield "segment", seg
+            seg = (pid, s, e)
+        if done:
+            yield "stats", row(p, e, first.pop(k, s))
+        elif k not in first:
+            first[k] = s
+    if seg is not None:
+        yield "segment", seg
+
+
+# ---------------- registry ----------------
+ALGORITHMS = {
+    "fcfs": fcfs,
+    "sjf_nonpreemptive": sjf_nonpreemptive,
+    "sjf_preemptive": sjf_preemptive,
+    "ljf_nonpreemptive": ljf_nonpreemptive,
+    "priority_nonpreemptive": priority_nonpreemptive,
+    "priority_preemptive": priority_preemptive,
+    "lrtf_preemptive": lrtf_preemptive,
+    "round_robin": round_robin,
+    "mlfq": mlfq,
+}
+# results of these depend on the quantum (MLFQ: the top level's, doubled per level)
+QUANTUM_ALGORITHMS = {"round_robin", "mlfq"}
+
+# GUI combobox label -> ALGORITHMS key
+ALGORITHM_LABELS = {
+    "FCFS": "fcfs",
+    "SJF (Non-Preemptive)": "sjf_nonpreemptive",
+    "SJF (Preemptive)": "sjf_preemptive",
+    "LJF (Non-Preemptive)": "ljf_nonpreemptive",
+    "Priority (Non-Preemptive)": "priority_nonpreemptive",
+    "Priority (Preemptive)": "priority_preemptive",
+    "LRTF (Preemptive)": "lrtf_preemptive",
+    "Round Robin": "round_robin",
+    "MLFQ": "mlfq",
+}
+
+def run_algorithm(name, processes, quantum=2):
+    """Run ALGORITHMS[name]; quantum is only used by QUANTUM_ALGORITHMS."""
+    if name not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm {name!r}")
+    if name == "round_robin":
+        return round_robin(processes, quantum)
+    if name == "mlfq":
+        return mlfq(processes, _mlfq_quanta(quantum))
+    return ALGORITHMS[name](processes)
+
+# ---------------- instrumentation ----------------
+class EngineMetrics:
+    """
+    Opt-in instrumentation for simulate(metrics=...). Wraps the dispatch
+    loop, so runs without it pay nothing. Counts dispatches, context switches,
+    preemptions, busy/idle time and the wall time of each scheduling
+    decision (one step of the engine), and tracks the ready-queue length -
+    as a [(time, length)] list in `timeline` when timeline=True. A
+    `profiler` with enable()/disable() (e.g. cProfile.Profile()) is switched
+    on around the loop only.
+    """
+    def __init__(self, timeline=False, profiler=None):
+        self.timeline = [] if timeline else None
+        self.profiler = profiler
+        self.dispatches = self.context_switches = self.preemptions = 0
+        self.completed = 0
+        self.busy = self.idle = 0
+        self.first = self.last = None
+        self.queue_area = 0; self.max_queue = 0
+        self.decision_s = 0.0; self.decision_max_s = 0.0
+
+    def wrap(self, steps, procs):
+        """Yield `steps` unchanged while recording; procs sorted by arrival."""
+        arrivals = iter([p[1] for p in procs if p[2] > 0])   # zero bursts never queue
+        nxt = next(arrivals, None)
+        timeline = self.timeline
+        clock = time.perf_counter
+        waiting = 0; qt = None            # ready-queue length, since time qt
+        prev_k = None; prev_done = True; prev_end = None
+
+        def queue(t, delta):
+            # same-time changes (a requeue then the next dispatch) don't
+            # count towards the max until the length holds for a while
+            nonlocal waiting, qt
+            if qt is not None and t > qt:
+                self.queue_area += waiting * (t - qt)
+                if waiting > self.max_queue: self.max_queue = waiting
+            waiting += delta; qt = t
+            if timeline is not None:
+                if timeline and timeline[-1][0] == t: timeline[-1] = (t, waiting)
+                else: timeline.append((t, waiting))
+
+        it = iter(steps)
+        if self.profiler is not None: self.profiler.enable()
+        try:
+            while True:
+                t0 = clock()
+                try:
+                    step = next(it)
+                except StopIteration:
+                    break
+                dt = clock() - t0
+                self.decision_s += dt
+                if dt > self.decision_max_s: self.decision_max_s = dt
+                k, p, s, e, done = step
+                self.dispatches += 1
+                switch = k != prev_k
+                if switch and prev_k is not None:
+                    self.context_switches += 1
+                    if not prev_done:    # the previous job went back to the queue
+                        self.preemptions += 1
+                        queue(prev_end, 1)
+                while nxt is not None and nxt <= s:
+                    queue(nxt, 1); nxt = next(arrivals, None)
+                if switch and p[2] > 0: queue(s, -1)
+                if prev_end is None: self.first = s
+                elif s > prev_end: self.idle += s - prev_end
+                self.busy += e - s
+                while nxt is not None and nxt <= e:
+                    queue(nxt, 1); nxt = next(arrivals, None)
+                if done: self.completed += 1
+                prev_k, prev_done, prev_end = k, done, e
+                yield step
+        finally:
+            if self.profiler is not None: self.profiler.disable()
+        if prev_end is not None: queue(prev_end, 0)
+        self.last = prev_end
+
+    def summary(self):
+        span = (self.last - self.first) if self.first is not None else 0
+        return {
+            "dispatches": self.dispatches,
+            "context_switches": self.context_switches,
+            "preemptions": self.preemptions,
+            "busy": self.busy, "idle": self.idle, "makespan": span,
+            "utilization": self.busy / span if span else 0.0,
+            "throughput": self.completed / span if span else 0.0,
+            "avg_queue": self.queue_area / span if span else 0.0,
+            "max_queue": self.max_queue,
+            "decision_avg_us": self.decision_s / self.dispatches * 1e6 if self.dispatches else 0.0,
+            "decision_max_us": self.decision_max_s * 1e6,
+        }
+
+class SimulationCancelled(Exception):
+    """Raised by simulate() when its progress callback asks to stop."""
+
+def simulate(name, processes, quantum=2, progress=None, every=2048, metrics=None):
+    """
+    run_algorithm with progress reporting: every `every` dispatches,
+    progress(finished, total) is called with the number of completed
+    processes; returning False cancels with SimulationCancelled.
+    An EngineMetrics passed as `metrics` is filled in during the run.
+    Same (gantt, stats) result as run_algorithm.
+    """
+    if name not in _STEPS:
+        raise ValueError(f"unknown algorithm {name!r}")
+    total = len(processes)
+    if name == "fcfs" and metrics is None and hasattr(processes, "fcfs"):
+        result = processes.fcfs()       # vectorized: no dispatches to report
+        if progress is not None:
+            progress(total, total)
+        return result
+    factory, merge = _STEPS[name]
+    procs = _by_arrival(processes)
+    finished = 0; count = 0
+
+    def steps():
+        nonlocal finished, count
+        for step in factory(procs, quantum):
+            yield step
+            finished += step[4]; count += 1
+            if progress is not None and count % every == 0:
+                if progress(finished, total) is False:
+                    raise SimulationCancelled(name)
+
+    run = steps()
+    if metrics is not None:
+        run = metrics.wrap(run, procs)
+    result = _collect(run, processes, merge)
+    if progress is not None:
+        progress(total, total)
+    return result
+
+# ---------------- incremental re-simulation ----------------
+def _common_prefix(a, b):
+    # length of the common prefix of two lists, compared in C a block at a time
+    n = min(len(a), len(b)); d = 0
+    while d < n and a[d:d + 4096] == b[d:d + 4096]:
+        d += 4096
+    while d < n and a[d] == b[d]:
+        d += 1
+    return min(d, n)
+
+def _merge_rows(stats, gone, new):
+    """
+    PID-sorted stats without the rows in `gone` (by identity) and with `new`
+    added. A new row for the PID of a gone one replaces it in stats itself;
+    only added and removed PIDs need a new list.
+    """
+    by_pid = {r[0]: r for r in new}
+    moved = []
+    for r in gone:
+        n = by_pid.pop(r[0], None)
+        if n is None:
+            moved.append(r); continue
+        i = bisect_left(stats, [r[0]])  # [pid] sorts just before pid's row
+        while stats[i] is not r: i += 1
+        stats[i] = n
+    if not moved and not by_pid:
+        return stats
+    gone = moved; new = sorted(by_pid.values(), key=itemgetter(0))
+    if 8 * (len(gone) + len(new)) > len(stats):
+        ids = set(map(id, gone))
+        out = [r for r in stats if id(r) not in ids] if ids else list(stats)
+        out += new
+        out.sort(key=itemgetter(0))     # two sorted runs: merged in one pass
+        return out
+    # few changes: find them by bisection and copy the runs between in slices
+    cuts = []
+    for r in gone:
+        i = bisect_left(stats, [r[0]])
+        while stats[i] is not r: i += 1
+        cuts.append((i, r, True))
+    cuts += [(bisect_left(stats, [r[0]]), r, False) for r in new]
+    cuts.sort(key=itemgetter(0))
+    out = []; i = 0
+    for pos, r, drop in cuts:
+        out += stats[i:pos]
+        if drop:
+            i = pos + 1
+        else:
+            out.append(r); i = max(i, pos)
+    out += stats[i:]
+    return out
+
+class IncrementalSchedule:
+    """
+    One algorithm's schedule, kept up to date as the process list is edited.
+    While running, the engine saves its state at intervals (see _CKPT_EVERY);
+    update(processes) finds the first process, in arrival order, that
+    differs from the previous run, resumes from the last checkpoint taken
+    before it arrived and only reschedules from there on, keeping the Gantt
+    prefix and the rows of processes that had already finished. A caller
+    that knows what it changed can instead pass that to edit() and call
+    update() without processes, which skips sorting and comparing the whole
+    list. The first update() is a full run. Results equal run_algorithm's,
+    provided PIDs are unique. Not thread-safe; a cancelled update() leaves
+    it usable.
+    """
+    def __init__(self, name, quantum=2):
+        if name not in _STEPS:
+            raise ValueError(f"unknown algorithm {name!r}")
+        self.name = name
+        self.quantum = quantum
+        self.procs = []            # arrival-ordered tuples of the last run, then edit()s
+        self.arrivals = []         # their arrival times, for bisection
+        self.changed = 0           # first position edit() changed since the last update()
+        self.gantt = SegmentStore()
+        self.rows = []             # stats rows in completion order
+        self.stats = []            # rows[:sorted_upto] and stale, sorted by PID
+        self.sorted_upto = 0
+        self.stale = []            # rows dropped from rows but still in stats, in completion order
+        self.first = {}            # first start of started, unfinished jobs by ordinal
+        # (pos, horizon, engine state, len(gantt), last segment end, len(rows), first)
+        self.checkpoints = []
+        self.resumed_at = 0        # processes skipped by the last update()
+
+    def _save(self, pos, horizon, state):
+        g = self.gantt
+        self.checkpoints.append((pos, horizon, state, len(g), g.end[-1] if len(g) else None,
+                                 len(self.rows), dict(self.first)))
+
+    def _restart(self, procs, d):
+        """
+        The newest checkpoint still valid for procs, whose first d entries
+        are those of the last run, or None; drops later ones.
+        """
+        cps = self.checkpoints
+        i = len(cps) - 1
+        while i >= 0:
+            pos, horizon = cps[i][0], cps[i][1]
+            if pos <= d and (horizon is None or pos >= len(procs) or procs[pos][1] > horizon):
+                break
+            i -= 1
+        del cps[i + 1:]
+        return cps[i] if i >= 0 else None
+
+    def edit(self, added=(), removed=()):
+        """
+        Change the process list of the last update() in place: drop the
+        `removed` rows, then insert the `added` ones after those with the
+        same arrival, as appending them to the input list would. update()
+        with no processes then reschedules the result.
+        """
+        procs = self.procs; arrivals = self.arrivals; d = self.changed
+        for r in removed:
+            pid, at = r[0], r[1]
+            i = bisect_left(arrivals, at); n = len(procs)
+            while i < n and arrivals[i] == at and procs[i][0] != pid:
+                i += 1
+            if i == n or arrivals[i] != at:
+                raise ValueError(f"process {pid!r} arriving at {at} is not in the schedule")
+            del procs[i]; del arrivals[i]
+            d = min(d, i)
+        for r in added:
+            r = tuple(r)
+            i = bisect_right(arrivals, r[1])
+            procs.insert(i, r); arrivals.insert(i, r[1])
+            d = min(d, i)
+        self.changed = d
+
+    def update(self, processes=None, progress=None, every=2048, metrics=None):
+        """
+        (gantt, stats) for `processes`, or for the list as edit() left it,
+        like run_algorithm; progress is as for simulate(), counting the
+        processes finished so far. `metrics` is only filled in when nothing
+        could be reused (resumed_at == 0).
+        """
+        if processes is None:
+            procs = self.procs; d = self.changed
+        else:
+            procs = sorted(map(tuple, processes), key=itemgetter(1))
+            d = min(self.changed, _common_prefix(self.procs, procs))
+            self.procs = procs; self.arrivals = [p[1] for p in procs]
+        self.changed = len(procs)
+        cp = self._restart(procs, d)
+        if cp is None:
+            state = None; self.resumed_at = 0
+            self.gantt = SegmentStore(); self.rows = []; self.first = {}
+            self.stats = []; self.stale = []; self.sorted_upto = 0
+        else:
+            self.resumed_at, _, state, glen, gend, nrows, first = cp
+            self.gantt.truncate(glen, gend)
+            if nrows < self.sorted_upto:
+                # left in stats until the run has redone them: most come out the same
+                self.stale[:0] = self.rows[nrows:self.sorted_upto]
+                self.sorted_upto = nrows
+            del self.rows[nrows:]
+            self.first = dict(first)
+        factory, merge = _STEPS[self.name]
+        run = factory(procs, self.quantum, ckpt=self._save, state=state)
+        if metrics is not None and state is None:
+            run = metrics.wrap(run, procs)
+        g = self.gantt; rows = self.rows; first = self.first
+        row = StatsAccumulator.make_row
+        index = g.index; pids = g.pids   # SegmentStore.emit / append, inlined as in _collect
+        lane = g.pid.append; st = g.start.append
+        ends = g.end; en = ends.append
+        last = pids[g.pid[-1]] if len(g) else None
+        end = ends[-1] if len(g) else None
+        total = len(procs); count = 0
+        for k, p, s, e, done in run:
+            pid = p[0]
+            if merge and pid == last and s == end:
+                ends[-1] = e
+            else:
+                i = index.get(pid)
+                if i is None:
+                    i = index[pid] = len(pids); pids.append(pid)
+                lane(i); st(s); en(e)
+                last = pid
+            end = e
+            if done:
+                rows.append(row(p, e, first.pop(k, s)))
+            elif k not in first:
+                first[k] = s
+            count += 1
+            if progress is not None and count % every == 0:
+                if progress(len(rows), total) is False:
+                    raise SimulationCancelled(self.name)
+        # rows redone unchanged keep the objects stats holds; only the rest is merged
+        done_from = self.sorted_upto; stale = self.stale
+        same = _common_prefix(stale, rows[done_from:])
+        rows[done_from:done_from + same] = stale[:same]
+        self.stats = _merge_rows(self.stats, stale[same:], rows[done_from + same:])
+        self.stale = []; self.sorted_upto = len(rows)
+        if progress is not None:
+            progress(total, total)
+        return g.copy(), list(self.stats)
+
+# ---------------- workload I/O ----------------
+def _to_process(rec, where):
+    try:
+        if isinstance(rec, dict):
+            return [str(rec["pid"]), int(rec["arrival"]), int(rec["burst"]),
+                    int(rec.get("priority") or 0)]
+        pid, at, bt = rec[0], rec[1], rec[2]
+        pr = rec[3] if len(rec) > 3 and rec[3] not in ("", None) else 0
+        return [str(pid), int(at), int(bt), int(pr)]
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise ValueError(f"{where}: bad process record {rec!r}") from e
+
+def iter_workload(path):
+    """
+    Lazily yield [pid, arrival, burst, priority] rows from a .csv
+    (header pid,arrival,burst[,priority]) or .jsonl file (one object or list
+    per line). A .json file is a list of objects or lists, or
+    {"processes": [...]}, and is parsed whole; a .sched file is mapped.
+    """
+    low = str(path).lower()
+    if low.endswith(".sched"):
+        import scheduler_io
+        yield from scheduler_io.load_workload(path)
+    elif low.endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data["processes"]
+        for i, r in enumerate(data):
+            yield _to_process(r, f"{path}[{i}]")
+    elif low.endswith(".jsonl"):
+        with open(path) as f:
+            for i, line in enumerate(f):
+                if line.strip():
+                    yield _to_process(json.loads(line), f"{path}:{i+1}")
+    else:
+        with open(path, newline="") as f:
+            for i, r in enumerate(csv.DictReader(f)):
+                yield _to_process(r, f"{path}:{i+2}")
+
+def load_workload(path):
+    """
+    Read a whole workload file into a list; see iter_workload for formats.
+    A binary .sched file (scheduler_io) is memory-mapped instead of copied.
+    """
+    if str(path).lower().endswith(".sched"):
+        import scheduler_io
+        return scheduler_io.load_workload(path)
+    return list(iter_workload(path))
+
+def random_workload(n, seed=None, max_arrival=None, max_burst=12, max_priority=10):
+    """
+    n seeded processes P1..Pn drawn like the GUI's Random button
+    (burst 1..max_burst, priority 1..max_priority); arrivals are spread
+    over 0..max_arrival, which defaults to 6*n to keep the CPU mostly busy.
+    """
+    rng = random.Random(seed)
+    if max_arrival is None: max_arrival = 6 * n
+    return [[f"P{i+1}", rng.randint(0, max_arrival), rng.randint(1, max_burst),
+             rng.randint(1, max_priority)] for i in range(n)]
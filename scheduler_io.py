@@ -0,0 +1,351 @@
+# scheduler_io.py
+# Binary .sched files for workloads and schedules, plus CSV / JSON import and export.
+#   python scheduler_io.py workload.csv session.sched -a round_robin -q 2
+#   python scheduler_io.py session.sched schedule.csv --schedule
+# Standard library only; with numpy installed, loaded workloads are columnar.
+#
+# .sched format, version 1. All integers little-endian.
+#   header, 64 bytes:
+#     magic      8s   b"CPUSCHD\0"
+#     version    u32  1
+#     flags      u32  1 workload present, 2 schedule present,
+#                     4 workload sorted by arrival, 8 PIDs are P1..Pn (no PID table)
+#     n_procs    u64  workload rows
+#     n_segs     u64  schedule segments
+#     n_pids     u64  PIDs in the table
+#     pid_bytes  u64  size of the PID table's UTF-8 blob
+#     zero padding up to 64 bytes
+#   then fixed-width columns, in this order, each starting on an 8-byte boundary:
+#     proc_pid   i32[n_procs]     index into the PID table
+#     arrival    i64[n_procs]
+#     burst      i64[n_procs]
+#     priority   i64[n_procs]
+#     seg_pid    i32[n_segs]      index into the PID table
+#     seg_start  i64[n_segs]
+#     seg_end    i64[n_segs]
+#     pid_off    i64[n_pids + 1]  PID i = pid_blob[pid_off[i]:pid_off[i+1]]
+#     pid_blob   u8[pid_bytes]
+#   (pid_off and pid_blob are empty when flag 8 is set.)
+# Column offsets follow from the header alone, so load() maps the file and
+# slices it; pages are read only when the schedulers or the Gantt view get there.
+import argparse, csv, json, mmap, struct, sys
+from array import array
+import scheduler_core as core
+from scheduler_core import SegmentStore
+
+try:
+    import numpy as np
+    from scheduler_columnar import Workload
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+MAGIC = b"CPUSCHD\0"
+VERSION = 1
+HEADER = struct.Struct("<8sII4Q")
+HEADER_SIZE = 64
+HAS_WORKLOAD, HAS_SCHEDULE, SORTED, SYNTHETIC_PIDS = 1, 2, 4, 8
+
+def _layout(n_procs, n_segs, n_pids, synthetic):
+    """Byte offset of every column (and the end of the file) for these counts."""
+    off = HEADER_SIZE; out = {}
+    for name, size in (("proc_pid", 4 * n_procs), ("arrival", 8 * n_procs),
+                       ("burst", 8 * n_procs), ("priority", 8 * n_procs),
+                       ("seg_pid", 4 * n_segs), ("seg_start", 8 * n_segs),
+                       ("seg_end", 8 * n_segs),
+                       ("pid_off", 0 if synthetic else 8 * (n_pids + 1))):
+        out[name] = off
+        off += size + (-size % 8)
+    out["pid_blob"] = off
+    return out
+
+# ---------------- reading ----------------
+class _PidTable:
+    # PID strings decoded on access from the mapped offsets and UTF-8 blob
+    def __init__(self, off, blob):
+        self.off = off; self.blob = blob
+
+    def __len__(self):
+        return len(self.off) - 1
+
+    def __getitem__(self, i):
+        if i < 0: i += len(self)
+        return str(self.blob[self.off[i]:self.off[i + 1]], "utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class _SyntheticPids:
+    def __init__(self, n): self.n = n
+    def __len__(self): return self.n
+    def __getitem__(self, i): return f"P{(i + self.n if i < 0 else i) + 1}"
+    def __iter__(self): return (f"P{i+1}" for i in range(self.n))
+
+class MappedWorkload:
+    """
+    Workload rows (pid, arrival, burst, priority) read straight from mapped
+    columns; what load() returns when numpy is not installed.
+    """
+    def __init__(self, names, pid, arrival, burst, priority, is_sorted):
+        self.names = names; self.pid = pid
+        self.arrival = arrival; self.burst = burst; self.priority = priority
+        self.is_sorted = is_sorted
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __getitem__(self, i):
+        return (self.names[self.pid[i]], self.arrival[i], self.burst[i], self.priority[i])
+
+    def __iter__(self):
+        names = self.names
+        for k, a, b, p in zip(self.pid, self.arrival, self.burst, self.priority):
+            yield (names[k], a, b, p)
+
+    def by_arrival(self):
+        return self if self.is_sorted else sorted(self, key=lambda p: p[1])
+
+def load(path):
+    """
+    Map a .sched file and return (processes, gantt), None for a part it
+    does not hold. processes is a scheduler_columnar.Workload over the mapped
+    columns (a MappedWorkload without numpy), gantt a read-only SegmentStore;
+    neither copies a column, so large files open in constant time.
+    """
+    if sys.byteorder != "little":
+        raise ValueError(".sched files can only be mapped on little-endian machines")
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:                      # empty file
+            raise ValueError(f"{path}: not a .sched file") from None
+    if len(mm) < HEADER_SIZE:
+        raise ValueError(f"{path}: not a .sched file")
+    magic, version, flags, n_procs, n_segs, n_pids, pid_bytes = HEADER.unpack_from(mm)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a .sched file")
+    if version != VERSION:
+        raise ValueError(f"{path}: .sched version {version}, expected {VERSION}")
+    synthetic = bool(flags & SYNTHETIC_PIDS)
+    lay = _layout(n_procs, n_segs, n_pids, synthetic)
+    if len(mm) < lay["pid_blob"] + pid_bytes:
+        raise ValueError(f"{path}: truncated .sched file")
+    buf = memoryview(mm)
+
+    def col(name, n, code):
+        o = lay[name]
+        return buf[o:o + n * (4 if code == "i" else 8)].cast(code)
+
+    if synthetic:
+        names = _SyntheticPids(n_pids)
+    else:
+        o = lay["pid_blob"]
+        names = _PidTable(col("pid_off", n_pids + 1, "q"), buf[o:o + pid_bytes])
+
+    processes = gantt = None
+    if flags & HAS_WORKLOAD:
+        pid, arrival = col("proc_pid", n_procs, "i"), col("arrival", n_procs, "q")
+        burst, priority = col("burst", n_procs, "q"), col("priority", n_procs, "q")
+        if _HAS_NUMPY:
+            as64 = lambda c: np.frombuffer(c, dtype=np.int64)
+            processes = Workload(as64(arrival), as64(burst), as64(priority),
+                                 np.frombuffer(pid, dtype=np.int32), None if synthetic else names)
+            if flags & SORTED: processes._sorted = processes
+        else:
+            processes = MappedWorkload(names, pid, arrival, burst, priority, bool(flags & SORTED))
+    if flags & HAS_SCHEDULE:
+        gantt = SegmentStore.wrap(names, col("seg_pid", n_segs, "i"),
+                                  col("seg_start", n_segs, "q"), col("seg_end", n_segs, "q"))
+    return processes, gantt
+
+# ---------------- writing ----------------
+def _le(a):
+    if sys.byteorder != "little": a.byteswap()
+    return a
+
+def _nondecreasing(vals):
+    it = iter(vals); prev = next(it, None)
+    for v in it:
+        if v < prev: return False
+        prev = v
+    return True
+
+def save(path, processes=None, gantt=None):
+    """
+    Write a .sched file holding a workload, a schedule (any Gantt list or
+    SegmentStore) or both. PIDs go into one shared table.
+    """
+    names = []; index = {}
+    def intern(pid):
+        i = index.get(pid)
+        if i is None:
+            i = index[pid] = len(names); names.append(pid)
+        return i
+
+    flags = 0; cols = []; n_procs = n_segs = 0
+    if processes is not None:
+        flags |= HAS_WORKLOAD
+        if _HAS_NUMPY and isinstance(processes, Workload):
+            w = processes
+            top = int(w.pid.max()) + 1 if len(w) else 0
+            for i in range(len(w.names) if w.names is not None else top):
+                intern(w.name(i))
+            cols = [np.ascontiguousarray(w.pid, dtype="<i4")] + [
+                np.ascontiguousarray(c, dtype="<i8") for c in (w.arrival, w.burst, w.priority)]
+            is_sorted = bool(np.all(w.arrival[1:] >= w.arrival[:-1]))
+        else:
+            cols = [_le(array("i", (intern(p[0]) for p in processes)))] + [
+                _le(array("q", (p[j] for p in processes))) for j in (1, 2, 3)]
+            is_sorted = _nondecreasing(cols[1])
+        n_procs = len(cols[1])
+        if is_sorted: flags |= SORTED
+    else:
+        cols = [b""] * 4
+    if gantt is not None:
+        flags |= HAS_SCHEDULE
+        if not isinstance(gantt, SegmentStore):
+            gantt = SegmentStore(gantt)
+        remap = [intern(p) for p in gantt.pids]
+        cols += [_le(array("i", (remap[k] for k in gantt.pid))),
+                 _le(array("q", gantt.start)), _le(array("q", gantt.end))]
+        n_segs = len(gantt)
+    else:
+        cols += [b""] * 3
+
+    synthetic = all(x == f"P{i+1}" for i, x in enumerate(names))
+    if synthetic:
+        flags |= SYNTHETIC_PIDS
+        blob = b""
+    else:
+        encoded = [str(x).encode() for x in names]
+        offs = array("q", [0]); total = 0
+        for e in encoded:
+            total += len(e); offs.append(total)
+        cols.append(_le(offs))
+        blob = b"".join(encoded)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, n_procs, n_segs, len(names), len(blob)))
+        f.write(b"\0" * (HEADER_SIZE - HEADER.size))
+        for c in cols:
+            size = memoryview(c).nbytes
+            f.write(c)
+            f.write(b"\0" * (-size % 8))
+        f.write(blob)
+
+# ---------------- CSV / JSON ----------------
+def _ext(path):
+    low = str(path).lower()
+    return low[low.rfind("."):] if "." in low else ""
+
+def load_workload(path):
+    """Workload from .sched (mapped), .csv, .json or .jsonl."""
+    if _ext(path) == ".sched":
+        processes = load(path)[0]
+        if processes is None:
+            raise ValueError(f"{path}: holds no workload")
+        return processes
+    return core.load_workload(path)
+
+def write_workload(processes, path):
+    """Write processes as .sched, .csv, .json or .jsonl (chosen by extension)."""
+    ext = _ext(path)
+    if ext == ".sched":
+        return save(path, processes)
+    keys = ("pid", "arrival", "burst", "priority")
+    with open(path, "w", newline="") as f:
+        if ext == ".csv":
+            w = csv.writer(f)
+            w.writerow(keys)
+            w.writerows(processes)
+        elif ext == ".jsonl":
+            for p in processes:
+                f.write(json.dumps(dict(zip(keys, p))) + "\n")
+        else:
+            json.dump([dict(zip(keys, p)) for p in processes], f, indent=1)
+            f.write("\n")
+
+def _segment(rec, where):
+    try:
+        if isinstance(rec, dict):
+            return (str(rec["pid"]), int(rec["start"]), int(rec["end"]))
+        return (str(rec[0]), int(rec[1]), int(rec[2]))
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise ValueError(f"{where}: bad segment {rec!r}") from e
+
+def load_schedule(path):
+    """
+    Gantt list (SegmentStore) from .sched, .csv (pid,start,end), a .json list
+    of [pid, start, end] or objects, or .jsonl - including the CLI's --stream
+    output, whose non-segment lines are skipped.
+    """
+    ext = _ext(path)
+    if ext == ".sched":
+        gantt = load(path)[1]
+        if gantt is None:
+            raise ValueError(f"{path}: holds no schedule")
+        return gantt
+    g = SegmentStore()
+    with open(path, newline="") as f:
+        if ext == ".csv":
+            for i, r in enumerate(csv.DictReader(f)):
+                g.append(*_segment(r, f"{path}:{i+2}"))
+        elif ext == ".jsonl":
+            for i, line in enumerate(f):
+                if not line.strip(): continue
+                rec = json.loads(line)
+                if isinstance(rec, dict) and rec.get("type", "segment") != "segment": continue
+                g.append(*_segment(rec, f"{path}:{i+1}"))
+        else:
+            data = json.load(f)
+            if isinstance(data, dict): data = data["gantt"]
+            for i, r in enumerate(data):
+                g.append(*_segment(r, f"{path}[{i}]"))
+    return g
+
+def write_schedule(gantt, path):
+    """Write a Gantt list as .sched, .csv, .json or .jsonl (chosen by extension)."""
+    ext = _ext(path)
+    if ext == ".sched":
+        return save(path, gantt=gantt)
+    with open(path, "w", newline="") as f:
+        if ext == ".csv":
+            w = csv.writer(f)
+            w.writerow(("pid", "start", "end"))
+            w.writerows(gantt)
+        elif ext == ".jsonl":
+            for pid, s, e in gantt:
+                f.write(json.dumps({"type": "segment", "pid": pid, "start": s, "end": e}) + "\n")
+        else:
+            json.dump([list(seg) for seg in gantt], f)
+            f.write("\n")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Convert workloads and schedules between "
+                                             ".sched, CSV, JSON and JSON Lines.")
+    ap.add_argument("source", help="workload file, or a schedule with --schedule")
+    ap.add_argument("dest", help="output file; the format follows the extension")
+    ap.add_argument("--schedule", action="store_true", help="source is a schedule, not a workload")
+    ap.add_argument("-a", "--algorithm", choices=sorted(core.ALGORITHMS),
+                    help="schedule the workload and write the result too (.sched) or instead")
+    ap.add_argument("-q", "--quantum", type=int, default=2)
+    args = ap.parse_args(argv)
+    try:
+        if args.schedule:
+            write_schedule(load_schedule(args.source), args.dest)
+            return 0
+        processes = load_workload(args.source)
+        gantt = core.run_algorithm(args.algorithm, processes, args.quantum)[0] if args.algorithm else None
+        if _ext(args.dest) == ".sched":
+            save(args.dest, processes, gantt)
+        elif gantt is not None:
+            write_schedule(gantt, args.dest)
+        else:
+            write_workload(processes, args.dest)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+# scheduler_service.py
+# Localhost HTTP/JSON service around the schedulers, for tools that should not
+# import the GUI (or Tk):
+#   python scheduler_service.py --port 8765 --workers 4
+#   curl -d '{"algorithm": "fcfs", "processes": [["P1", 0, 5, 1]]}' 127.0.0.1:8765/simulate
+# Standard library only.
+#
+# GET  /health, /stats
+# POST /workloads  {"processes": [...]} or {"path": "w.csv"}    -> {"workload": id, "n": n}
+# POST /simulate   {"algorithm": a, "quantum": 2, "workload": id (or "processes" /
+#                  "path"), "gantt": false}                       -> run_batch-style result
+#                  plus "workload", "cached" and "timing" (queue_ms, compute_ms,
+#                  total_ms, batch = requests dispatched together)
+# POST /batch      {"requests": [simulate bodies]}                -> {"results": [...]}
+# Errors come back as {"error": text} with status 400 (bad input), 404
+# (unknown workload) or 500.
+import argparse, json, os, queue, shutil, sys, tempfile, threading, time
+import urllib.error, urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import scheduler_core as core
+import scheduler_io
+from scheduler_cache import ResultCache, cache_key, workload_fingerprint
+from scheduler_cli import STAT_FIELDS
+
+# ---------------- pool workers ----------------
+@lru_cache(maxsize=8)
+def _workload(path):
+    # spooled .sched files are memory-mapped once per worker and never change
+    return core.load_workload(path)
+
+def _warm(delay):
+    time.sleep(delay)     # keeps this worker busy so the pool starts the others
+    return os.getpid()
+
+def _run_group(path, jobs):
+    """[(started, compute_s, gantt, stats)] for each (algorithm, quantum) in jobs."""
+    procs = _workload(path)
+    out = []
+    for name, q in jobs:
+        t0 = time.monotonic()   # system-wide, so comparable with the service's stamps
+        gantt, stats = core.run_algorithm(name, procs, 2 if q is None else q)
+        out.append((t0, time.monotonic() - t0, gantt, stats))
+    return out
+
+# ---------------- service ----------------
+class UnknownWorkload(KeyError):
+    """No workload registered under this id (evicted, or never registered)."""
+
+class SimulationService:
+    """
+    Schedules through a warm process pool. Workloads are parsed once by
+    register(), which returns their fingerprint as the id to simulate with;
+    each is spooled to a .sched file the workers map instead of receiving
+    pickled rows. submit() queues a request: a dispatcher thread collects
+    requests for up to `batch_ms` (at most `max_batch`), drops duplicates
+    and splits each workload's runs into at most one pool task per worker.
+    A workload evicted past `max_workloads` keeps its file until the runs
+    queued on it are done. Finished results are kept in a ResultCache, so repeated requests skip
+    the pool.
+    """
+    def __init__(self, workers=None, batch_ms=2.0, max_batch=256, max_workloads=64, cache=None):
+        self.batch_s = batch_ms / 1000
+        self.max_batch = max_batch
+        self.max_workloads = max_workloads
+        self.cache = cache if cache is not None else ResultCache(maxsize=256)
+        self.counters = {"requests": 0, "cache_hits": 0, "batches": 0, "pool_tasks": 0}
+        self._spool = tempfile.mkdtemp(prefix="sched-service-")
+        self._workloads = OrderedDict()       # id -> (path, n)
+        self._pending = {}                    # path -> requests queued on it
+        self._evicted = set()                 # paths to delete once not pending
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        # start every worker now, before any thread exists to be forked
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.workers)
+        list(self.pool.map(_warm, [0.05] * self.workers))
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self.pool.shutdown()
+        shutil.rmtree(self._spool, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # workloads
+    def register(self, processes=None, path=None):
+        """(id, n) for rows or a workload file; an unchanged workload keeps its id."""
+        if path is not None:
+            processes = core.load_workload(path)
+        if processes is None:
+            raise ValueError("give processes or a path")
+        processes = [core._to_process(r, f"process {i}") for i, r in enumerate(processes)]
+        fp = workload_fingerprint(processes)
+        with self._lock:
+            if fp in self._workloads:
+                self._workloads.move_to_end(fp)
+                return fp, self._workloads[fp][1]
+        f = os.path.join(self._spool, fp + ".sched")
+        with self._lock:
+            kept = f in self._evicted       # evicted but still pinned: reuse the file
+            self._evicted.discard(f)
+        if not kept:
+            # never rewrite in place: a worker may have the file mapped already
+            # (a concurrent register() of the same workload), and truncating a
+            # mapped file kills it with SIGBUS
+            tmp = f"{f}.{threading.get_ident()}.tmp"
+            scheduler_io.save(tmp, processes)
+            os.replace(tmp, f)
+        with self._lock:
+            self._workloads[fp] = (f, len(processes))
+            while len(self._workloads) > self.max_workloads:
+                _, (old, _) = self._workloads.popitem(last=False)
+                if self._pending.get(old):
+                    self._evicted.add(old)  # queued runs still need it; see _release
+                else:
+                    os.remove(old)     # workers that mapped it keep their mapping
+        return fp, len(processes)
+
+    def workload(self, fp):
+        with self._lock:
+            if fp not in self._workloads:
+                raise UnknownWorkload(fp)
+            self._workloads.move_to_end(fp)
+            return self._workloads[fp]
+
+    # requests
+    def submit(self, name, fp, quantum=2):
+        """
+        Future of (gantt, stats, timing) for ALGORITHMS[name] on workload fp;
+        timing has queue_ms, compute_ms and batch (0 for a cache hit).
+        """
+        if name not in core.ALGORITHMS:
+            raise ValueError(f"unknown algorithm {name!r}")
+        q = int(quantum) if name in core.QUANTUM_ALGORITHMS else None
+        if q is not None and q < 1:
+            raise ValueError("quantum must be at least 1")
+        key = cache_key(fp, name, q)
+        fut = Future()
+        hit = self.cache.get(key)
+        with self._lock:
+            if fp not in self._workloads:
+                raise UnknownWorkload(fp)
+            path, _ = self._workloads[fp]
+            self._workloads.move_to_end(fp)
+            self.counters["requests"] += 1
+            if hit is not None:
+                self.counters["cache_hits"] += 1
+            else:     # pinned, so eviction cannot delete the file under the request
+                self._pending[path] = self._pending.get(path, 0) + 1
+        if hit is not None:
+            fut.set_result((hit[0], hit[1], {"queue_ms": 0.0, "compute_ms": 0.0, "batch": 0}))
+            return fut
+        self._queue.put((key, path, name, q, time.monotonic(), fut))
+        return fut
+
+    def _dispatch(self):
+        while True:
+            req = self._queue.get()
+            if req is None:
+                return
+            batch = [req]
+            deadline = time.monotonic() + self.batch_s
+            while len(batch) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    req = self._queue.get(timeout=left)
+                except queue.Empty:
+                    break
+                if req is None:
+                    self._queue.put(None)    # stop after this batch
+                    break
+                batch.append(req)
+            self._send(batch)
+
+    def _send(self, batch):
+        groups = {}   # path -> {(name, q): [requests]}, in arrival order
+        for req in batch:
+            groups.setdefault(req[1], {}).setdefault((req[2], req[3]), []).append(req)
+        tasks = []
+        for path, jobs in groups.items():
+            jobs = list(jobs.items())
+            k = min(self.workers, len(jobs))
+            tasks += [(path, jobs[i::k]) for i in range(k)]
+        with self._lock:
+            self.counters["batches"] += 1
+            self.counters["pool_tasks"] += len(tasks)
+        for path, jobs in tasks:
+            try:
+                task = self.pool.submit(_run_group, path, [job for job, _ in jobs])
+            except Exception as e:       # pool shut down or broken
+                self._release(path, jobs)
+                for _, reqs in jobs:
+                    for r in reqs: r[5].set_exception(e)
+                continue
+            task.add_done_callback(lambda t, path=path, jobs=jobs, n=len(batch):
+                                  self._finish(t, path, jobs, n))
+
+    def _release(self, path, jobs):
+        # unpin the requests in jobs; an evicted workload's file goes with the last
+        with self._lock:
+            left = self._pending[path] - sum(len(reqs) for _, reqs in jobs)
+            if left:
+                self._pending[path] = left
+                return
+            del self._pending[path]
+            if path not in self._evicted:
+                return
+            self._evicted.discard(path)
+        os.remove(path)
+
+    def _finish(self, task, path, jobs, n):
+        self._release(path, jobs)
+        try:
+            results = task.result()
+        except Exception as e:
+            for _, reqs in jobs:
+                for r in reqs: r[5].set_exception(e)
+            return
+        for (_, reqs), (started, compute_s, gantt, stats) in zip(jobs, results):
+            self.cache.put(reqs[0][0], (gantt, stats))
+            for r in reqs:
+                r[5].set_result((gantt, stats, {"queue_ms": max(started - r[4], 0.0) * 1000,
+                                                "compute_ms": compute_s * 1000, "batch": n}))
+
+    def stats(self):
+        with self._lock:
+            out = dict(self.counters, workers=self.workers, workloads=len(self._workloads))
+        out["avg_batch"] = (out["requests"] - out["cache_hits"]) / out["batches"] if out["batches"] else 0.0
+        return out
+
+# ---------------- HTTP ----------------
+def _jsonable(o):
+    # SegmentStore -> [[pid, s, e], ...]; NumPy scalars from mapped workloads
+    return o.tolist() if hasattr(o, "tolist") else list(o)
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "SchedulerService/1"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _reply(self, status, obj):
+        body = json.dumps(obj, default=_jsonable).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/health":
+            self._reply(200, {"status": "ok", "workers": service.workers,
+                              "algorithms": sorted(core.ALGORITHMS)})
+        elif self.path == "/stats":
+            self._reply(200, service.stats())
+        else:
+            self._reply(404, {"error": f"no such endpoint {self.path}"})
+
+    def do_POST(self):
+        t0 = time.monotonic()
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            if self.path == "/workloads":
+                fp, n = self.server.service.register(body.get("processes"), body.get("path"))
+                self._reply(200, {"workload": fp, "n": n})
+            elif self.path == "/simulate":
+                self._reply(200, self._simulate([body], t0)[0])
+            elif self.path == "/batch":
+                reqs = body.get("requests")
+                if not isinstance(reqs, list):
+                    raise ValueError('"requests" must be a list')
+                self._reply(200, {"results": self._simulate(reqs, t0)})
+            else:
+                self._reply(404, {"error": f"no such endpoint {self.path}"})
+        except UnknownWorkload as e:
+            self._reply(404, {"error": f"unknown workload {e.args[0]!r}"})
+        except KeyError as e:
+            self._reply(400, {"error": f"missing field {e.args[0]!r}"})
+        except (ValueError, TypeError, OSError) as e:
+            self._reply(400, {"error": str(e)})
+        except Exception as e:
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def _simulate(self, bodies, t0):
+        service = self.server.service
+        pending = []
+        for body in bodies:    # submit everything first so it lands in one batch
+            fp = body.get("workload")
+            if fp is None:
+                fp, _ = service.register(body.get("processes"), body.get("path"))
+            name = body.get("algorithm", "fcfs")
+            fut = service.submit(name, fp, body.get("quantum", 2))
+            pending.append((body, fp, name, fut))
+        out = []
+        for body, fp, name, fut in pending:
+            gantt, stats, timing = fut.result()
+            res = {"algorithm": name,
+                   "quantum": body.get("quantum", 2) if name in core.QUANTUM_ALGORITHMS else None,
+                   "workload": fp,
+                   "summary": core.aggregate_stats(stats),
+                   "stats": [dict(zip(STAT_FIELDS, row)) for row in stats],
+                   "cached": timing["batch"] == 0,
+                   "timing": dict(timing, total_ms=(time.monotonic() - t0) * 1000)}
+            if body.get("gantt"):
+                res["gantt"] = gantt
+            out.append(res)
+        return out
+
+def serve(service, host="127.0.0.1", port=8765, verbose=False):
+    """A ThreadingHTTPServer for `service`; call serve_forever() (port 0 picks a free one)."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+def call(url, payload=None, timeout=60):
+    """Client helper: GET url, or POST payload as JSON; returns the decoded reply."""
+    data = None if payload is None else json.dumps(payload).encode()
+    req = urllib.request.Request(url, data, {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            return json.load(r)
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(f"{e.code}: {json.load(e).get('error')}") from None
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve the schedulers over HTTP/JSON on localhost.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("-j", "--workers", type=int, help="pool processes (default: CPU count)")
+    ap.add_argument("--batch-ms", type=float, default=2.0, help="how long a batch collects requests")
+    ap.add_argument("--max-batch", type=int, default=256)
+    ap.add_argument("-v", "--verbose", action="store_true", help="log every request to stderr")
+    args = ap.parse_args(argv)
+    with SimulationService(args.workers, args.batch_ms, args.max_batch) as service:
+        server = serve(service, args.host, args.port, args.verbose)
+        print(f"serving on http://{server.server_address[0]}:{server.server_address[1]} "
+              f"with {service.workers} workers", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
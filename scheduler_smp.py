@@ -0,0 +1,193 @@
+# scheduler_smp.py
+# Multi-CPU scheduling: the single-CPU policies of scheduler_core run on N
+# cores, with one global ready queue or per-core queues plus work stealing.
+#   lanes, stats, info = smp_schedule("round_robin", procs, cpus=8, queues="per_core")
+# Standard library only.
+import heapq, random
+from collections import deque
+import scheduler_core as core
+
+# name -> (ready key(p, rem), or None for FIFO; for preemptive policies
+# worst(p, end): smallest = the running job a newcomer should displace,
+# `end` being when it would finish uninterrupted)
+_POLICIES = {
+    "fcfs": (None, None),
+    "round_robin": (None, None),
+    "sjf_nonpreemptive": (lambda p, r: p[2], None),
+    "ljf_nonpreemptive": (lambda p, r: -p[2], None),
+    "priority_nonpreemptive": (lambda p, r: p[3], None),
+    "sjf_preemptive": (core._srtf_key, lambda p, end: -end),
+    "priority_preemptive": (core._priority_rem_key, lambda p, end: (-p[3], -end)),
+}
+SMP_ALGORITHMS = list(_POLICIES)
+QUEUES = ("global", "per_core")
+
+def smp_schedule(name, processes, cpus=2, quantum=2, queues="global", steal=True, seed=0):
+    """
+    Event-driven schedule of `processes` on `cpus` identical cores.
+
+    queues="global": one shared ready queue; an idle core (lowest index
+    first) takes its head, and preemptive policies displace the worst running
+    job on any core. queues="per_core": each core has its own queue;
+    arrivals go to an idle core if there is one, else to the shorter of two
+    randomly picked queues (seeded), and only preempt that core. With
+    `steal`, a core that runs dry takes work from the longest queue.
+    With cpus=1 every policy gives the same schedule as scheduler_core.
+
+    Returns (lanes, stats, info): lanes[c] is core c's Gantt list of
+    (pid, start, end) as a SegmentStore, stats the usual _compute_stats_from_gantt rows, info a
+    dict with makespan, per-core busy time and utilization, migrations
+    (stolen jobs) and preemptions.
+    """
+    if name not in _POLICIES:
+        raise ValueError(f"{name!r} has no multi-CPU version (choose from {', '.join(_POLICIES)})")
+    if queues not in QUEUES:
+        raise ValueError(f"queues must be one of {QUEUES}")
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    key, worst = _POLICIES[name]
+    fifo = key is None
+    preemptive = worst is not None
+    tslice = max(quantum, 1) if name == "round_robin" else None
+    merge = core._STEPS[name][1]
+    shared = queues == "global"
+    C = cpus
+    heappush, heappop, heappushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+
+    ready = [deque() if fifo else [] for _ in range(1 if shared else C)]
+    running = [None] * C        # (entry, start); entry = [k, p, rem]
+    token = [0] * C             # bumped on every start/stop; stale events are skipped
+    events = []                 # (time, core, token) slice ends
+    runheap = []                # global + preemptive: (worst(p, end), core, token)
+    idle = list(range(C))       # heap of idle cores
+    lanes = [core.SegmentStore() for _ in range(C)]
+    busy = [0] * C
+    rows = []; first = {}       # stats rows as jobs finish; first start by ordinal
+    make_row = core.StatsAccumulator.make_row
+    rng = random.Random(seed)
+    counts = {"migrations": 0, "preemptions": 0}
+
+    def start(c, e, t):
+        running[c] = (e, t)
+        tok = token[c] = token[c] + 1
+        r = e[2]
+        heappush(events, (t + (r if tslice is None or r < tslice else tslice), c, tok))
+        if preemptive and shared:
+            heappush(runheap, (worst(e[1], t + r), c, tok))
+
+    def stop(c, t):
+        e, s = running[c]
+        running[c] = None
+        token[c] += 1
+        rem = e[2] = e[2] - (t - s)
+        p = e[1]; pid = p[0]
+        if merge: lanes[c].emit(pid, s, t)
+        else: lanes[c].append(pid, s, t)
+        busy[c] += t - s
+        if rem == 0:
+            rows.append(make_row(p, t, first.pop(e[0], s)))
+        elif e[0] not in first:
+            first[e[0]] = s
+        return e
+
+    def preempt(c, rq, t):
+        # rq's head beats the job on core c: swap them, like the single core
+        # does (the displaced job goes ahead of equal-key waiters)
+        nonlocal back
+        e = stop(c, t)
+        back -= 1
+        counts["preemptions"] += 1
+        start(c, heappushpop(rq, (key(e[1], e[2]), back, e))[2], t)
+
+    it = iter(core._by_arrival(processes)); nxt = next(it, None)
+    seq = 0; back = 0; queued = 0
+    while True:
+        if events:
+            t = events[0][0]
+            if nxt is not None and nxt[1] < t: t = nxt[1]
+        elif nxt is not None:
+            t = nxt[1]
+        else:
+            break
+
+        freed = []; expired = []
+        while events and events[0][0] <= t:
+            _, c, tok = heappop(events)
+            if tok != token[c]:
+                continue
+            e = stop(c, t)
+            freed.append(c)
+            if e[2] > 0: expired.append((c, e))      # Round Robin slice used up
+
+        woken = []; touched = []
+        while nxt is not None and nxt[1] <= t:
+            p = nxt; nxt = next(it, None)
+            if preemptive and p[2] <= 0:
+                seq += 1; continue
+            e = [seq, p, p[2]]
+            if shared: q = 0
+            elif idle:
+                q = heappop(idle); woken.append(q)
+            else:
+                a = rng.randrange(C); b = rng.randrange(C)
+                q = a if len(ready[a]) <= len(ready[b]) else b
+                touched.append(q)
+            if fifo: ready[q].append(e)
+            else: heappush(ready[q], (key(p, p[2]), seq, e))
+            seq += 1; queued += 1
+        for c, e in expired:                            # after same-time arrivals
+            ready[0 if shared else c].append(e); queued += 1
+
+        if shared:
+            for c in freed: heappush(idle, c)
+            rq = ready[0]
+            while idle and rq:
+                start(heappop(idle), rq.popleft() if fifo else heappop(rq)[2], t); queued -= 1
+            if preemptive:
+                while rq:
+                    while runheap and runheap[0][2] != token[runheap[0][1]]:
+                        heappop(runheap)
+                    if not runheap: break
+                    c = runheap[0][1]
+                    e, s = running[c]
+                    if not rq[0][0] < key(e[1], e[2] - (t - s)): break
+                    heappop(runheap)
+                    preempt(c, rq, t)
+                if len(runheap) > 4 * C:
+                    runheap = [x for x in runheap if x[2] == token[x[1]]]
+                    heapq.heapify(runheap)
+            continue
+
+        for c in woken + freed:
+            rq = ready[c]
+            if rq:
+                start(c, rq.popleft() if fifo else heappop(rq)[2], t); queued -= 1
+            else:
+                heappush(idle, c)
+        if preemptive:
+            for c in touched:
+                rq = ready[c]
+                if rq and running[c] is not None:
+                    e, s = running[c]
+                    if rq[0][0] < key(e[1], e[2] - (t - s)):
+                        preempt(c, rq, t)
+        while steal and idle and queued:
+            v = max(range(C), key=lambda i: len(ready[i]))
+            rq = ready[v]
+            # FIFO queues give up their newest job, keyed ones their best
+            start(heappop(idle), rq.pop() if fifo else heappop(rq)[2], t)
+            queued -= 1
+            counts["migrations"] += 1
+
+    makespan = max((lane[-1][2] for lane in lanes if lane), default=0)
+    info = {"cpus": C, "queues": queues, "makespan": makespan, "busy": busy,
+            "utilization": [b / makespan if makespan else 0.0 for b in busy]}
+    info.update(counts)
+    rows.sort(key=lambda x: x[0])
+    return lanes, rows, info
+
+def flatten(lanes):
+    """All lanes as one time-ordered list of (pid, start, end, cpu)."""
+    segs = [(pid, s, e, c) for c, lane in enumerate(lanes) for pid, s, e in lane]
+    segs.sort(key=lambda x: (x[1], x[3]))
+    return segs
@@ -0,0 +1,155 @@
+# scheduler_sweep.py
+# Parameter sweep: algorithms x quanta (Round Robin, MLFQ) x workloads (files or seeds),
+# run across a process pool and streamed into one table.
+#   python scheduler_sweep.py -a all -q 1 -q 2 -q 4 --seeds 0-99 -n 1000 -j 64 -o sweep.csv
+import argparse, csv, sys
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
+import scheduler_core as core
+from scheduler_cache import ResultCache, cache_key, workload_fingerprint
+
+COLUMNS = ["workload", "seed", "algorithm", "quantum", "n",
+           "avg_tat", "avg_wt", "avg_rt", "makespan"]
+
+@lru_cache(maxsize=4)
+def _load(spec):
+    # spec = (path, None, None) or (None, seed, n); cached so a worker loads each
+    # workload once no matter how many of its tasks it gets
+    path, seed, n = spec
+    if path is not None:
+        return core.load_workload(path)
+    return core.random_workload(n, seed)
+
+@lru_cache(maxsize=4)
+def _fingerprint(spec):
+    return workload_fingerprint(_load(spec))
+
+@lru_cache(maxsize=None)
+def _cache(path):
+    # one per worker process; workers share results through the directory
+    return ResultCache(maxsize=8, path=path)
+
+def _row(spec, algorithm, quantum, gantt, done):
+    agg = core.aggregate_stats(done)
+    return {
+        "workload": spec[0] or "",
+        "seed": "" if spec[1] is None else spec[1],
+        "algorithm": algorithm,
+        "quantum": "" if quantum is None else quantum,
+        "n": agg["n"],
+        "avg_tat": agg.get("avg_tat"),
+        "avg_wt": agg.get("avg_wt"),
+        "avg_rt": agg.get("avg_rt"),
+        "makespan": (max(r[4] for r in done) - min(r[1] for r in done)) if done else 0,
+    }
+
+def _run_task(task):
+    spec, algorithm, quanta, cache_dir = task
+    procs = _load(spec)
+    cache = _cache(cache_dir) if cache_dir else None
+    if algorithm not in core.QUANTUM_ALGORITHMS:
+        if cache is not None:
+            return [_row(spec, algorithm, None, *cache.run(algorithm, procs, None, _fingerprint(spec)))]
+        return [_row(spec, algorithm, None, *core.run_algorithm(algorithm, procs))]
+    res, todo = {}, list(quanta)
+    if cache is not None:
+        keys = {q: cache_key(_fingerprint(spec), algorithm, q) for q in quanta}
+        for q in quanta:
+            hit = cache.get(keys[q])
+            if hit is not None:
+                res[q] = hit
+        todo = [q for q in quanta if q not in res]
+    if todo:
+        if algorithm == "round_robin":
+            fresh = core.round_robin_sweep(procs, todo)
+        else:
+            fresh = {q: core.run_algorithm(algorithm, procs, q) for q in todo}
+        if cache is not None:
+            for q in todo:
+                cache.put(keys[q], fresh[q])
+        res.update(fresh)
+    return [_row(spec, algorithm, q, *res[q]) for q in quanta]
+
+def make_tasks(algorithms, quanta, workloads=(), seeds=(), n=1000, chunk=None, cache_dir=None):
+    """
+    One task per (workload, algorithm); Round Robin and MLFQ tasks are split into
+    quanta chunks of `chunk` so a single workload still spreads over cores.
+    Tasks are grouped by workload so each worker's cache stays hot.
+    With `cache_dir`, results are looked up in / saved to a ResultCache there.
+    """
+    specs = [(p, None, None) for p in workloads] + [(None, s, n) for s in seeds]
+    tasks = []
+    for spec in specs:
+        for a in algorithms:
+            if a not in core.QUANTUM_ALGORITHMS:
+                tasks.append((spec, a, None, cache_dir)); continue
+            step = chunk or len(quanta)
+            for i in range(0, len(quanta), step):
+                tasks.append((spec, a, tuple(quanta[i:i+step]), cache_dir))
+    return tasks
+
+def sweep(algorithms, quanta=(2,), workloads=(), seeds=(), n=1000, workers=None, chunk=None,
+          cache_dir=None):
+    """
+    Yield one row dict (see COLUMNS) per algorithm/quantum/workload as soon as
+    it is computed. workers=1 runs in-process; None uses every core.
+    """
+    quanta = list(quanta)
+    tasks = make_tasks(algorithms, quanta, workloads, seeds, n, chunk, cache_dir)
+    workers = workers or cpu_count()
+    if workers == 1 or len(tasks) <= 1:
+        for t in tasks:
+            yield from _run_task(t)
+        return
+    # make_tasks lays each workload's tasks out together; with a workload per
+    # worker or more, hand them out as one chunk so every workload is loaded
+    # once. Fewer workloads than workers still spread task by task.
+    n_specs = len(workloads) + len(seeds)
+    chunksize = len(tasks) // n_specs if n_specs >= workers else 1
+    with Pool(min(workers, len(tasks))) as pool:
+        for rows in pool.imap_unordered(_run_task, tasks, chunksize):
+            yield from rows
+
+def _parse_seeds(text):
+    seeds = []
+    for part in text.split(","):
+        lo, _, hi = part.partition("-")
+        seeds.extend(range(int(lo), int(hi) + 1) if hi else [int(lo)])
+    return seeds
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Sweep scheduling algorithms over quanta and workloads.")
+    ap.add_argument("workloads", nargs="*", help="workload files (.csv or .json)")
+    ap.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                    choices=sorted(core.ALGORITHMS) + ["all"], help="repeatable, default: all")
+    ap.add_argument("-q", "--quantum", action="append", type=int, dest="quanta",
+                    help="Round Robin quantum, MLFQ top-level quantum (repeatable, default: 2)")
+    ap.add_argument("--seeds", type=_parse_seeds, default=[],
+                    help="random workload seeds, e.g. 0-99 or 1,5,7")
+    ap.add_argument("-n", type=int, default=1000, help="processes per random workload")
+    ap.add_argument("-j", "--workers", type=int, help="worker processes (default: all cores)")
+    ap.add_argument("--chunk", type=int, help="quanta per Round Robin / MLFQ task")
+    ap.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR from earlier sweeps")
+    ap.add_argument("-o", "--output", help="CSV output (default: stdout)")
+    args = ap.parse_args(argv)
+    if not args.workloads and not args.seeds:
+        ap.error("give workload files and/or --seeds")
+    algorithms = args.algorithms or ["all"]
+    if "all" in algorithms:
+        algorithms = list(core.ALGORITHMS)
+
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        w = csv.DictWriter(out, COLUMNS)
+        w.writeheader()
+        for row in sweep(algorithms, args.quanta or [2], args.workloads, args.seeds,
+                         args.n, args.workers, args.chunk, args.cache):
+            w.writerow(row)
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# scheduler_worker.py
+# Runs one simulation off the caller's thread (the Tk main loop) with
+# progress messages and cancellation; SimulationSession does the same for
+# incremental re-runs after edits. Standard library only.
+import multiprocessing as mp
+import gc, queue, threading
+import scheduler_core as core
+
+PROCESS_THRESHOLD = 20000   # workloads at least this big run in a child process
+
+def _without_gc(get):
+    # unpickling a result makes a fresh list per stats row and nothing cyclic:
+    # the collector only slows it down (several times over, for 200k rows)
+    enabled = gc.isenabled(); gc.disable()
+    try:
+        return get()
+    finally:
+        if enabled: gc.enable()
+
+def _work(name, processes, quantum, out, cancel, instrument, session, edits=None):
+    def progress(finished, total):
+        out.put(("progress", finished / total if total else 1.0))
+        return not cancel.is_set()
+    metrics = core.EngineMetrics() if instrument else None
+    try:
+        if session is None:
+            gantt, stats = core.simulate(name, processes, quantum, progress, metrics=metrics)
+        else:
+            if edits is not None:
+                session.edit(*edits)
+            gantt, stats = session.update(processes, progress, metrics=metrics)
+            if session.resumed_at: metrics = None
+            out.put(("resumed", session.resumed_at))
+        out.put(("done", (gantt, stats, metrics and metrics.summary())))
+    except core.SimulationCancelled:
+        out.put(("cancelled", None))
+    except Exception as e:
+        out.put(("error", f"{type(e).__name__}: {e}"))
+
+class SimulationJob:
+    """
+    Background run of scheduler_core.simulate. Workloads under
+    PROCESS_THRESHOLD processes use a daemon thread; bigger ones a separate
+    process, so the GIL never starves the GUI. Call poll() from a timer: it
+    returns the messages received so far without blocking -
+    ("progress", fraction), then one of ("done", (gantt, stats, metrics)),
+    ("cancelled", None) or ("error", text). metrics is the
+    EngineMetrics.summary() dict with instrument=True, else None.
+
+    With a core.IncrementalSchedule as `session` (for name and quantum),
+    the run is session.update(processes), always on a thread - the
+    schedule stays in this process (SimulationSession keeps big ones in a
+    child process instead); processes=None reschedules the list as
+    session.edit() left it. `resumed_at` is then set once done, and
+    metrics only cover runs that reused nothing.
+    """
+    def __init__(self, name, processes, quantum=2, use_process=None, instrument=False, session=None):
+        if processes is not None or session is None:
+            processes = list(processes)
+        if session is not None and use_process:
+            raise ValueError("a session is updated in this process; see SimulationSession")
+        if use_process is None:
+            use_process = session is None and len(processes) >= PROCESS_THRESHOLD
+        self.use_process = use_process
+        self.finished = False
+        self.resumed_at = None
+        if use_process:
+            self._q = mp.Queue(); self._cancel = mp.Event()
+            runner = mp.Process
+        else:
+            self._q = queue.Queue(); self._cancel = threading.Event()
+            runner = threading.Thread
+        self._worker = runner(target=_work, daemon=True,
+                              args=(name, processes, quantum, self._q, self._cancel, instrument, session))
+        self._worker.start()
+
+    def poll(self):
+        msgs = []
+        while True:
+            try:
+                msg = _without_gc(self._q.get_nowait) if self.use_process else self._q.get_nowait()
+            except queue.Empty:
+                break
+            if msg[0] == "resumed":
+                self.resumed_at = msg[1]; continue
+            msgs.append(msg)
+            if msg[0] != "progress":
+                self.finished = True
+                self._worker.join()
+                break
+        if not msgs and self.use_process and not self._worker.is_alive() and not self.finished:
+            # the child died without reporting (killed, out of memory, ...)
+            self.finished = True
+            msgs.append(("error", f"worker exited with code {self._worker.exitcode}"))
+        return msgs
+
+    def cancel(self):
+        """Ask the run to stop; poll() will then report ("cancelled", None)."""
+        self._cancel.set()
+
+# ---------------- incremental sessions ----------------
+class _Tagged:
+    # one run's view of the session process's out queue and cancel counter
+    def __init__(self, out, cancelled, tag):
+        self.out, self.cancelled, self.tag = out, cancelled, tag
+
+    def put(self, msg):
+        self.out.put((self.tag,) + msg)
+
+    def is_set(self):
+        return self.cancelled.value >= self.tag
+
+def _serve(cmds, out, cancelled):
+    # session process: keeps the schedule between runs, answers in run order
+    # processes is None when the run sends edits to the last run's list instead
+    session = None
+    for tag, name, processes, quantum, instrument, edits in iter(lambda: _without_gc(cmds.get), None):
+        if session is None or (session.name, session.quantum) != (name, quantum):
+            session = core.IncrementalSchedule(name, quantum)
+        run = _Tagged(out, cancelled, tag)
+        _work(name, processes, quantum, run, run, instrument, session, edits)
+
+class _SessionRun:
+    """SimulationJob-like handle on one run in a SimulationSession's process."""
+    def __init__(self, proc, out, cancelled, tag):
+        self._proc, self._out, self._cancelled, self._tag = proc, out, cancelled, tag
+        self.use_process = True
+        self.finished = False
+        self.resumed_at = None
+
+    def poll(self):
+        msgs = []
+        while not self.finished:
+            try:
+                tag, kind, val = _without_gc(self._out.get_nowait)
+            except queue.Empty:
+                break
+            if tag != self._tag:
+                continue            # left over from a run given up on
+            if kind == "resumed":
+                self.resumed_at = val; continue
+            msgs.append((kind, val))
+            self.finished = kind != "progress"
+        if not msgs and not self.finished and not self._proc.is_alive():
+            self.finished = True
+            msgs.append(("error", f"worker exited with code {self._proc.exitcode}"))
+        return msgs
+
+    def cancel(self):
+        cancelled = self._cancelled
+        with cancelled.get_lock():
+            cancelled.value = max(cancelled.value, self._tag)
+
+class SimulationSession:
+    """
+    Incremental re-simulation (core.IncrementalSchedule) across edits of a
+    workload, run in the background like SimulationJob: run() returns a job
+    with the same poll() and cancel(), and `resumed_at` once done. Below
+    PROCESS_THRESHOLD processes the schedule is kept here and updated on a
+    thread. Bigger workloads move it to a child process that stays up
+    between runs: each run sends the process list and gets (gantt, stats)
+    back, like a one-off job, and the schedule is never pickled. One run
+    at a time: start the next once the last has finished, or after close(),
+    which drops the schedule and stops the child.
+
+    A caller that tracks its edits passes them to run() as edits=(added,
+    removed) rows, what changed in `processes` since its last run(). If
+    that run was for the same algorithm and quantum, only the edits are
+    applied to the kept schedule (core.IncrementalSchedule.edit) and sent to
+    the child, not the whole list.
+    """
+    def __init__(self):
+        self.schedule = None     # the in-process IncrementalSchedule, if any
+        self._proc = None
+        self._tag = 0
+        self._key = None         # (name, quantum) of the child's schedule
+
+    def run(self, name, processes, quantum=2, instrument=False, edits=None):
+        processes = list(processes)
+        if self._proc is None and len(processes) < PROCESS_THRESHOLD:
+            s = self.schedule
+            if s is None or (s.name, s.quantum) != (name, quantum):
+                s = self.schedule = core.IncrementalSchedule(name, quantum)
+            elif edits is not None:
+                s.edit(*edits); processes = None
+            return SimulationJob(name, processes, quantum, False, instrument, s)
+        self.schedule = None
+        if self._proc is None or not self._proc.is_alive():
+            self._cmds = mp.Queue(); self._out = mp.Queue(); self._cancelled = mp.Value("q", 0)
+            self._tag = 0; self._key = None
+            self._proc = mp.Process(target=_serve, daemon=True,
+                                    args=(self._cmds, self._out, self._cancelled))
+            self._proc.start()
+        self._tag += 1
+        if edits is not None and self._key == (name, quantum):
+            self._cmds.put((self._tag, name, None, quantum, instrument, edits))
+        else:
+            self._cmds.put((self._tag, name, processes, quantum, instrument, None))
+        self._key = (name, quantum)
+        return _SessionRun(self._proc, self._out, self._cancelled, self._tag)
+
+    def close(self):
+        """Forget the schedule; a run still going in the child is cancelled."""
+        self.schedule = None
+        if self._proc is not None:
+            with self._cancelled.get_lock():
+                self._cancelled.value = self._tag
+            self._cmds.put(None)
+            self._proc = None
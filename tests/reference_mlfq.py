@@ -0,0 +1,57 @@
+# tests/reference_mlfq.py
+# Tick-by-tick multilevel feedback queue, written for clarity rather than
+# speed: the reference scheduler_core._mlfq_steps must reproduce exactly.
+#   - jobs enter level 0 and drop a level once they have run quanta[level]
+#     ticks there, over any number of runs; the last level is Round Robin
+#   - a job below level 0 is preempted when a higher level has work, and goes
+#     back to the head of its own level
+#   - every `period` ticks (0 for never) all jobs return to level 0, in level
+#     order, with their allotments reset
+#   - arrivals of a tick are queued before the job that just used up its slice
+from reference_schedulers import _compute_stats_from_gantt
+
+def mlfq(processes, quanta, period):
+    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
+    last = len(quanta) - 1
+    levels = [[] for _ in quanta]          # of [pid, remaining, used]
+    running = None; lvl = 0                # the job on the CPU and its level
+    gantt = []
+    time = 0; i = 0; left = len(procs)
+    while left:
+        while i < len(procs) and procs[i][1] == time:
+            levels[0].append([procs[i][0], procs[i][2], 0]); i += 1
+
+        # slice used up: drop a level (the last level just requeues)
+        if running is not None and running[2] >= quanta[lvl]:
+            running[2] = 0
+            levels[min(lvl + 1, last)].append(running); running = None
+
+        # boost: everything back to level 0
+        if period and time > 0 and time % period == 0:
+            if running is not None:
+                levels[lvl].insert(0, running); running = None
+            for level in levels[1:]:
+                levels[0].extend(level); level.clear()
+            for job in levels[0]:
+                job[2] = 0
+
+        # a higher level has work: back to the head of our level
+        if running is not None and any(levels[:lvl]):
+            levels[lvl].insert(0, running); running = None
+
+        if running is None:
+            for l, level in enumerate(levels):
+                if level:
+                    running = level.pop(0); lvl = l
+                    break
+
+        if running is not None:
+            if gantt and gantt[-1][0] == running[0] and gantt[-1][2] == time:
+                gantt[-1] = (running[0], gantt[-1][1], time + 1)
+            else:
+                gantt.append((running[0], time, time + 1))
+            running[1] -= 1; running[2] += 1
+            if running[1] == 0:
+                running = None; left -= 1
+        time += 1
+    return gantt, _compute_stats_from_gantt(gantt, processes)
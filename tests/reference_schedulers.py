@@ -0,0 +1,191 @@
+# tests/reference_schedulers.py
+# The original per-tick schedulers, as they were in cpu scheduling simulator.py
+# before the scheduling core was split out. Kept verbatim as the reference the
+# event-driven engines in scheduler_core must reproduce exactly.
+
+# ---------------- compute stats ----------------
+def _compute_stats_from_gantt(gantt, processes):
+    """
+    [pid, arrival, burst, priority, completion, TAT, WT, RT]
+    """
+    proc_map = {p[0]: {"arrival": p[1], "burst": p[2], "priority": p[3]} for p in processes}
+    done = []
+
+    for pid in proc_map:
+        segs = [s for s in gantt if s[0] == pid]
+        if not segs:
+            continue
+
+        first_start = segs[0][1]
+        completion = max(s[2] for s in segs)
+        arrival = proc_map[pid]["arrival"]
+        burst = proc_map[pid]["burst"]
+
+        tat = completion - arrival
+        wt = tat - burst
+        rt = first_start - arrival
+
+        done.append([pid, arrival, burst, proc_map[pid]["priority"],
+                     completion, tat, wt, rt])
+
+    done.sort(key=lambda x: x[0])
+    return done
+
+# ---------------- scheduling algorithms ----------------
+def fcfs(processes):
+    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
+    gantt = []
+    time = 0
+    for p in procs:
+        if time < p[1]: time = p[1]
+        start = time
+        time += p[2]
+        gantt.append((p[0], start, time))
+    return gantt, _compute_stats_from_gantt(gantt, processes)
+
+def sjf_nonpreemptive(processes):
+    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
+    ready = []
+    gantt = []
+    time = 0
+    while procs or ready:
+        while procs and procs[0][1] <= time:
+            ready.append(procs.pop(0))
+        if ready:
+            ready.sort(key=lambda x: x[2])
+            p = ready.pop(0)
+            start = time
+            time += p[2]
+            gantt.append((p[0], start, time))
+        else:
+            time = procs[0][1] if procs else time
+    return gantt, _compute_stats_from_gantt(gantt, processes)
+
+def sjf_preemptive(processes):
+    # SRTF
+    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
+    rem = {p[0]: p[2] for p in procs}
+    ready = []
+    gantt=[]
+    time=0
+    ai=0
+    while ai<len(procs) or ready:
+        while ai<len(procs) and procs[ai][1]<=time:
+            ready.append(procs[ai]); ai+=1
+        if not ready:
+            time = procs[ai][1]; continue
+        ready.sort(key=lambda x: rem[x[0]])
+        p = ready[0]
+        pid = p[0]
+        start = time
+        time+=1
+        rem[pid]-=1
+        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
+            gantt[-1]=(pid, gantt[-1][1], time)
+        else:
+            gantt.append((pid,start,time))
+        if rem[pid]==0:
+            ready=[r for r in ready if r[0]!=pid]
+    return gantt, _compute_stats_from_gantt(gantt,processes)
+
+def ljf_nonpreemptive(processes):
+    # LONGEST JOB FIRST
+    procs = sorted([p[:] for p in processes], key=lambda x: x[1])
+    ready=[]; gantt=[]; time=0
+    while procs or ready:
+        while procs and procs[0][1]<=time:
+            ready.append(procs.pop(0))
+        if ready:
+            ready.sort(key=lambda x: x[2], reverse=True)
+            p=ready.pop(0)
+            pid,at,bt,pr = p
+            start=time
+            time+=bt
+            gantt.append((pid,start,time))
+        else:
+            time=procs[0][1] if procs else time
+    return gantt,_compute_stats_from_gantt(gantt,processes)
+
+def priority_nonpreemptive(processes):
+    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
+    ready=[]; gantt=[]; time=0
+    while procs or ready:
+        while procs and procs[0][1]<=time:
+            ready.append(procs.pop(0))
+        if ready:
+            ready.sort(key=lambda x:x[3])
+            p=ready.pop(0)
+            start=time
+            time+=p[2]
+            gantt.append((p[0],start,time))
+        else:
+            time=procs[0][1] if procs else time
+    return gantt,_compute_stats_from_gantt(gantt,processes)
+
+def priority_preemptive(processes):
+    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
+    rem={p[0]:p[2] for p in procs}
+    ready=[]; gantt=[]; time=0; ai=0
+    while ai<len(procs) or ready:
+        while ai<len(procs) and procs[ai][1]<=time:
+            ready.append(procs[ai]); ai+=1
+        if not ready:
+            time=procs[ai][1]; continue
+        ready.sort(key=lambda x:(x[3], rem[x[0]]))
+        p=ready[0]; pid=p[0]
+        start=time; time+=1; rem[pid]-=1
+        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
+            gantt[-1]=(pid,gantt[-1][1],time)
+        else:
+            gantt.append((pid,start,time))
+        if rem[pid]==0:
+            ready=[r for r in ready if r[0]!=pid]
+    return gantt,_compute_stats_from_gantt(gantt,processes)
+
+def lrtf_preemptive(processes):
+    # Longest Remaining Time First
+    procs=sorted([p[:] for p in processes], key=lambda x:x[1])
+    rem={p[0]:p[2] for p in procs}
+    ready=[]; gantt=[]; time=0; ai=0
+    while ai<len(procs) or ready:
+        while ai<len(procs) and procs[ai][1]<=time:
+            ready.append(procs[ai]); ai+=1
+        if not ready:
+            time=procs[ai][1]; continue
+        ready.sort(key=lambda x:(-rem[x[0]], x[1]))
+        p=ready[0]; pid=p[0]
+        start=time; time+=1; rem[pid]-=1
+        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
+            gantt[-1]=(pid,gantt[-1][1],time)
+        else:
+            gantt.append((pid,start,time))
+        if rem[pid]==0:
+            ready=[r for r in ready if r[0]!=pid]
+    return gantt,_compute_stats_from_gantt(gantt,processes)
+
+def round_robin(processes, quantum):
+    if quantum<=0: quantum=1
+    procs = sorted([p[:] for p in processes], key=lambda x:x[1])
+    rem={p[0]:p[2] for p in procs}
+    time=0; queue=[]; gantt=[]; ai=0; completed=set()
+    total=len(procs)
+    while len(completed)<total:
+        while ai<len(procs) and procs[ai][1]<=time:
+            queue.append(procs[ai]); ai+=1
+        if not queue:
+            time=procs[ai][1]; continue
+        p=queue.pop(0); pid=p[0]
+        start=time
+        exec_t=min(quantum, rem[pid])
+        time+=exec_t; rem[pid]-=exec_t
+        if gantt and gantt[-1][0]==pid and gantt[-1][2]==start:
+            gantt[-1]=(pid,gantt[-1][1],time)
+        else:
+            gantt.append((pid,start,time))
+        while ai<len(procs) and procs[ai][1]<=time:
+            queue.append(procs[ai]); ai+=1
+        if rem[pid]==0:
+            completed.add(pid)
+        else:
+            queue.append(p)
+    return gantt,_compute_stats_from_gantt(gantt,processes)
@@ -0,0 +1,59 @@
+# tests/test_equivalence.py
+# Randomized check: every scheduler in scheduler_core gives exactly the Gantt
+# chart and stats of the original per-tick implementation.
+#   python -m pytest tests      or      python -m unittest discover tests
+import os, random, sys, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import scheduler_core as core
+import reference_schedulers as ref
+
+BASELINE = ["fcfs", "sjf_nonpreemptive", "sjf_preemptive", "ljf_nonpreemptive",
+            "priority_nonpreemptive", "priority_preemptive", "lrtf_preemptive", "round_robin"]
+TRIALS = 1500
+
+def random_processes(rng, n=None):
+    # small spreads, so ties in arrival, burst and priority are common
+    n = rng.randint(1, 12) if n is None else n
+    ps = [[f"P{i+1}", rng.randint(0, rng.choice([3, 10, 40])), rng.randint(1, rng.choice([3, 8, 20])),
+           rng.randint(1, 4)] for i in range(n)]
+    rng.shuffle(ps)
+    return ps
+
+class BaselineEquivalence(unittest.TestCase):
+    def check(self, name, procs, quantum):
+        args = (quantum,) if name == "round_robin" else ()
+        want = getattr(ref, name)([p[:] for p in procs], *args)
+        got = core.run_algorithm(name, procs, quantum)
+        self.assertEqual(list(got[0]), want[0], (name, quantum, procs))
+        self.assertEqual(got[1], want[1], (name, quantum, procs))
+        return got
+
+    def test_random_workloads(self):
+        for trial in range(TRIALS):
+            rng = random.Random(trial)
+            procs = random_processes(rng)
+            for name in BASELINE:
+                self.check(name, procs, rng.randint(1, 4))
+
+    def test_simulate_and_stream_match(self):
+        for trial in range(TRIALS // 4):
+            rng = random.Random(10000 + trial)
+            procs = random_processes(rng)
+            for name in BASELINE:
+                q = rng.randint(1, 4)
+                want = self.check(name, procs, q)
+                self.assertEqual(core.simulate(name, procs, q, progress=lambda f, t: None, every=1), want)
+                events = list(core.stream_schedule(name, sorted(procs, key=lambda p: p[1]), q))
+                self.assertEqual([x for k, x in events if k == "segment"], list(want[0]))
+                self.assertEqual(sorted((x for k, x in events if k == "stats"), key=lambda r: r[0]), want[1])
+
+    def test_single_level_mlfq_is_round_robin(self):
+        for trial in range(TRIALS // 4):
+            rng = random.Random(20000 + trial)
+            procs = random_processes(rng)
+            q = rng.randint(1, 4)
+            self.assertEqual(core.mlfq(procs, [q], boost=0), self.check("round_robin", procs, q))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# tests/test_incremental.py
+# Randomized check: IncrementalSchedule.update after edits, additions,
+# deletions and cancelled runs - given the whole list or only what edit()
+# changed - gives exactly what a full run_algorithm does.
+import os, random, sys, time, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scheduler_core as core
+import scheduler_worker
+
+TRIALS = 150
+
+def edit(rng, procs, next_id):
+    """Apply one random edit in place; returns the next unused PID number."""
+    op = rng.random()
+    if op < 0.4 and procs:
+        i = rng.randrange(len(procs))
+        p = procs.pop(i)
+        procs.insert(i, [p[0], max(0, p[1] + rng.randint(-3, 3)), rng.randint(0, 8), rng.randint(0, 5)])
+    elif op < 0.7 or not procs:
+        procs.append([f"P{next_id}", rng.randint(0, 2 * len(procs) + 5), rng.randint(0, 8), rng.randint(0, 5)])
+        next_id += 1
+    else:
+        procs.pop(rng.randrange(len(procs)))
+    return next_id
+
+def gui_edit(rng, procs, next_id):
+    """
+    Edit procs in place as the GUI does - removed rows anywhere, new and
+    changed ones appended; returns (next_id, added, removed).
+    """
+    added, removed = [], []
+    def drop():
+        row = procs.pop(rng.randrange(len(procs)))
+        if any(r is row for r in added): added.remove(row)
+        else: removed.append(row)
+        return row
+    for _ in range(rng.randint(1, 3)):
+        op = rng.random()
+        if op < 0.6 or not procs:
+            row = [f"P{next_id}", rng.randint(0, 2 * len(procs) + 5), rng.randint(0, 8), rng.randint(0, 5)]
+            next_id += 1
+            if op < 0.3 and procs:      # edit: the old row goes, the changed one is appended
+                old = drop()
+                row[0] = old[0]; row[1] = max(0, old[1] + rng.randint(-3, 3))
+            procs.append(row); added.append(row)
+        else:
+            drop()
+    return next_id, added, removed
+
+class IncrementalEquivalence(unittest.TestCase):
+    def setUp(self):
+        # checkpoint often, so small workloads resume from the middle
+        self._every = core._CKPT_EVERY
+        core._CKPT_EVERY = 4
+
+    def tearDown(self):
+        core._CKPT_EVERY = self._every
+
+    def test_edits_match_full_runs(self):
+        for trial in range(TRIALS):
+            rng = random.Random(trial)
+            n = rng.choice([5, 40, 300])
+            procs = [[f"P{i}", rng.randint(0, n), rng.randint(0, 8), rng.randint(0, 5)] for i in range(n)]
+            name = rng.choice(list(core._STEPS)); q = rng.randint(1, 4)
+            inc = core.IncrementalSchedule(name, q); next_id = n
+            for step in range(6):
+                if step:
+                    next_id = edit(rng, procs, next_id)
+                got = inc.update(procs)
+                self.assertEqual(got, core.run_algorithm(name, procs, q), (name, q, trial, step))
+
+    def test_cancelled_updates_leave_it_usable(self):
+        for trial in range(TRIALS):
+            rng = random.Random(1000 + trial)
+            n = rng.choice([20, 200])
+            procs = [[f"P{i}", rng.randint(0, n), rng.randint(0, 8), rng.randint(0, 5)] for i in range(n)]
+            name = rng.choice(list(core._STEPS)); q = rng.randint(1, 4)
+            inc = core.IncrementalSchedule(name, q); next_id = n
+            for step in range(5):
+                if step:
+                    next_id = edit(rng, procs, next_id)
+                if rng.random() < 0.6:
+                    calls = iter(range(rng.randint(1, 40)))    # then cancel, if still running
+                    try:
+                        inc.update(procs, progress=lambda f, t: next(calls, None) is not None, every=1)
+                    except core.SimulationCancelled:
+                        pass
+                    next_id = edit(rng, procs, next_id)
+                self.assertEqual(inc.update(procs), core.run_algorithm(name, procs, q), (name, q, trial, step))
+
+    def test_edit_matches_full_runs(self):
+        for trial in range(TRIALS):
+            rng = random.Random(2000 + trial)
+            n = rng.choice([5, 40, 300])
+            procs = [[f"P{i}", rng.randint(0, n), rng.randint(0, 8), rng.randint(0, 5)] for i in range(n)]
+            name = rng.choice(list(core._STEPS)); q = rng.randint(1, 4)
+            inc = core.IncrementalSchedule(name, q); next_id = n
+            inc.update(procs)
+            for step in range(6):
+                next_id, added, removed = gui_edit(rng, procs, next_id)
+                inc.edit(added, removed)
+                if rng.random() < 0.3:
+                    calls = iter(range(rng.randint(1, 40)))
+                    try:
+                        inc.update(progress=lambda f, t: next(calls, None) is not None, every=1)
+                    except core.SimulationCancelled:
+                        pass
+                got = inc.update(procs) if rng.random() < 0.2 else inc.update()
+                self.assertEqual(got, core.run_algorithm(name, procs, q), (name, q, trial, step))
+
+    def test_edit_unknown_process(self):
+        inc = core.IncrementalSchedule("fcfs")
+        inc.update([["A", 0, 3, 1], ["B", 2, 1, 1]])
+        with self.assertRaises(ValueError):
+            inc.edit(removed=[["A", 1, 3, 1]])
+
+class SessionRuns(unittest.TestCase):
+    def run_job(self, job):
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            for kind, val in job.poll():
+                if kind != "progress":
+                    return kind, val
+            time.sleep(0.005)
+        self.fail("no result")
+
+    def check_session(self, threshold):
+        old = scheduler_worker.PROCESS_THRESHOLD
+        scheduler_worker.PROCESS_THRESHOLD = threshold
+        try:
+            rng = random.Random(7)
+            procs = [[f"P{i}", rng.randint(0, 300), rng.randint(1, 8), rng.randint(0, 5)] for i in range(300)]
+            session = scheduler_worker.SimulationSession(); next_id = 300
+            for step in range(4):
+                if step:
+                    next_id = edit(rng, procs, next_id)
+                job = session.run("round_robin", procs, 3)
+                kind, val = self.run_job(job)
+                self.assertEqual(kind, "done")
+                self.assertEqual(val[:2], core.run_algorithm("round_robin", procs, 3))
+                self.assertIsNotNone(job.resumed_at)
+            job = session.run("round_robin", procs, 3); job.cancel()
+            self.assertIn(self.run_job(job)[0], ("cancelled", "done"))
+            kind, val = self.run_job(session.run("round_robin", procs, 3))
+            self.assertEqual(val[:2], core.run_algorithm("round_robin", procs, 3))
+            # only the edits go to the session; a new algorithm needs the list
+            for name in ("round_robin", "round_robin", "sjf_preemptive", "sjf_preemptive"):
+                next_id, added, removed = gui_edit(rng, procs, next_id)
+                job = session.run(name, procs, 3, edits=(added, removed))
+                kind, val = self.run_job(job)
+                self.assertEqual(kind, "done")
+                self.assertEqual(val[:2], core.run_algorithm(name, procs, 3))
+            session.close()
+        finally:
+            scheduler_worker.PROCESS_THRESHOLD = old
+
+    def test_thread_session(self):
+        self.check_session(10 ** 9)
+
+    def test_process_session(self):
+        self.check_session(1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# tests/test_io.py
+# .sched round trips: workload and schedule, named and synthetic P1..Pn PIDs,
+# mapped with and without numpy; mapped schedules must pickle.
+import os, pickle, random, sys, tempfile, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scheduler_core as core
+import scheduler_io
+from scheduler_core import SegmentStore
+
+def workloads():
+    rng = random.Random(5)
+    synthetic = core.random_workload(400, seed=5)
+    named = [[f"job-{i}é", a, b, p] for i, (_, a, b, p) in enumerate(synthetic)]
+    rng.shuffle(named)                          # unsorted, so the SORTED flag stays clear
+    return {"synthetic": synthetic, "named": named}
+
+class SchedRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "w.sched")
+        self._numpy = scheduler_io._HAS_NUMPY
+
+    def tearDown(self):
+        scheduler_io._HAS_NUMPY = self._numpy
+        self.dir.cleanup()
+
+    def round_trip(self, with_numpy):
+        if with_numpy and not self._numpy:
+            self.skipTest("numpy not installed")
+        scheduler_io._HAS_NUMPY = with_numpy
+        for kind, procs in workloads().items():
+            gantt, stats = core.run_algorithm("round_robin", procs, 3)
+            scheduler_io.save(self.path, procs, gantt)
+            loaded, mapped = scheduler_io.load(self.path)
+            self.assertEqual([tuple(p) for p in loaded], [tuple(p) for p in procs], kind)
+            self.assertEqual(mapped, gantt, kind)
+            self.assertEqual(set(mapped.pids), set(gantt.pids) | {p[0] for p in procs}, kind)
+            self.assertEqual(core.run_algorithm("round_robin", loaded, 3), (gantt, stats), kind)
+            copy = pickle.loads(pickle.dumps(mapped))
+            self.assertEqual(copy, gantt, kind)
+            copy.append("extra", gantt[-1][2], gantt[-1][2] + 1)    # the copy is a writable store
+            self.assertEqual(len(copy), len(gantt) + 1)
+            del loaded, mapped
+            scheduler_io.save(self.path, gantt=gantt)
+            self.assertEqual(scheduler_io.load(self.path)[0], None)
+            self.assertEqual(scheduler_io.load_schedule(self.path), gantt, kind)
+
+    def test_with_numpy(self):
+        self.round_trip(True)
+
+    def test_without_numpy(self):
+        self.round_trip(False)
+
+    def test_pickle_store(self):
+        g = SegmentStore([("A", 0, 2), ("B", 2, 5), ("A", 5, 6)])
+        copy = pickle.loads(pickle.dumps(g))
+        self.assertEqual(copy, g)
+        self.assertEqual(copy.index, {"A": 0, "B": 1})
+
+if __name__ == "__main__":
+    unittest.main()
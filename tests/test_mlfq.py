@@ -0,0 +1,91 @@
+# tests/test_mlfq.py
+# Multilevel MLFQ against the tick-by-tick reference: demotion, arrival
+# preemption, boosts, and resuming the engine from its checkpoints.
+import os, random, sys, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import scheduler_core as core
+import reference_mlfq as ref
+from test_equivalence import random_processes, TRIALS
+
+def segments(gantt):
+    return [(p, s, e) for p, s, e in gantt]
+
+class MlfqEquivalence(unittest.TestCase):
+    def check(self, procs, quanta, boost):
+        period = 8 * quanta[-1] if boost is None else boost
+        want = ref.mlfq(procs, quanta, period)
+        got = core.mlfq(procs, quanta, boost)
+        self.assertEqual(list(got[0]), want[0], (quanta, boost, procs))
+        self.assertEqual(got[1], want[1], (quanta, boost, procs))
+        return got
+
+    def test_random_workloads(self):
+        for trial in range(TRIALS // 2):
+            rng = random.Random(30000 + trial)
+            procs = random_processes(rng, rng.randint(1, 25))
+            quanta = [rng.randint(1, 5) for _ in range(rng.randint(2, 4))]
+            self.check(procs, quanta, rng.choice([None, 0, rng.randint(1, 40)]))
+
+    def test_gui_quanta(self):
+        for trial in range(TRIALS // 4):
+            rng = random.Random(40000 + trial)
+            procs = random_processes(rng)
+            q = rng.randint(1, 4)
+            want = self.check(procs, core._mlfq_quanta(q), None)
+            self.assertEqual(core.run_algorithm("mlfq", procs, q), want)
+
+    def test_demotion_and_arrival_preemption(self):
+        # A uses its level-1 slice of 4 in two runs (4-5, 6-9) around B's
+        # arrival, resumes ahead of C, and drops a level at 9, not at 10
+        got = self.check([["A", 0, 12, 1], ["C", 1, 12, 1], ["B", 5, 1, 1]], [2, 4, 8], 0)
+        self.assertEqual(segments(got[0]), [("A", 0, 2), ("C", 2, 4), ("A", 4, 5), ("B", 5, 6),
+                                            ("A", 6, 9), ("C", 9, 13), ("A", 13, 19), ("C", 19, 25)])
+
+    def test_boost_resets_allotments(self):
+        # the boost at 12 cuts B's level-1 slice after 2 ticks; back on level
+        # 1 at 16 it gets a whole slice of 6 again, and A the same at 22-24
+        got = self.check([["A", 0, 20, 1], ["B", 0, 20, 1]], [2, 6], 12)
+        self.assertEqual(segments(got[0]), [("A", 0, 2), ("B", 2, 4), ("A", 4, 10), ("B", 10, 14),
+                                            ("A", 14, 16), ("B", 16, 22), ("A", 22, 26), ("B", 26, 28),
+                                            ("A", 28, 34), ("B", 34, 40)])
+
+class MlfqCheckpoints(unittest.TestCase):
+    def setUp(self):
+        self._every = core._CKPT_EVERY
+        core._CKPT_EVERY = 3
+
+    def tearDown(self):
+        core._CKPT_EVERY = self._every
+
+    def test_resume_from_every_checkpoint(self):
+        for trial in range(TRIALS // 10):
+            rng = random.Random(50000 + trial)
+            procs = sorted(random_processes(rng, rng.randint(5, 40)), key=lambda p: p[1])
+            quanta = [rng.randint(1, 4) for _ in range(rng.randint(1, 3))]
+            boost = rng.choice([None, 0, rng.randint(1, 30)])
+            steps, saved = [], []
+            ckpt = lambda pos, horizon, state: saved.append((len(steps), state))
+            for step in core._mlfq_steps(procs, quanta, boost, ckpt=ckpt):
+                steps.append(step)
+            self.assertTrue(saved)
+            for at, state in saved:
+                resumed = list(core._mlfq_steps(procs, quanta, boost, state=state))
+                self.assertEqual(resumed, steps[at:], (quanta, boost, at))
+
+    def test_incremental_edits(self):
+        for trial in range(TRIALS // 10):
+            rng = random.Random(60000 + trial)
+            procs = random_processes(rng, 60)
+            q = rng.randint(1, 3)
+            inc = core.IncrementalSchedule("mlfq", q)
+            for step in range(4):
+                if step:
+                    procs.append([f"X{step}", rng.randint(0, 80), rng.randint(1, 9), 1])
+                want = ref.mlfq(procs, core._mlfq_quanta(q), 8 * core._mlfq_quanta(q)[-1])
+                got = inc.update(procs)
+                self.assertEqual((list(got[0]), got[1]), want, (q, trial, step))
+            self.assertIsNotNone(inc.resumed_at)
+
+if __name__ == "__main__":
+    unittest.main()
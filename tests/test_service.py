@@ -0,0 +1,115 @@
+# tests/test_service.py
+# The HTTP service, offline against 127.0.0.1: results equal run_algorithm's,
+# cache hits, eviction while runs are queued, and the error replies.
+import json, os, sys, tempfile, threading, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scheduler_core as core
+from scheduler_service import SimulationService, serve, call
+
+def as_rows(res):
+    return [list(d.values()) for d in res["stats"]]
+
+class ServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = SimulationService(workers=2, batch_ms=5, max_workloads=2)
+        cls.server = serve(cls.service, port=0)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.workload = core.random_workload(300, seed=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown(); cls.server.server_close()
+        cls.service.close()
+
+    def post(self, endpoint, payload):
+        return call(self.base + endpoint, payload)
+
+    def error(self, endpoint, payload):
+        with self.assertRaises(RuntimeError) as cm:
+            self.post(endpoint, payload)
+        return str(cm.exception)
+
+    def test_health(self):
+        health = call(self.base + "/health")
+        self.assertEqual(health["status"], "ok")
+        self.assertEqual(health["algorithms"], sorted(core.ALGORITHMS))
+
+    def test_simulate_matches_run_algorithm(self):
+        wid = self.post("/workloads", {"processes": self.workload})["workload"]
+        results = {}
+        def client(name, q):
+            results[name, q] = self.post("/simulate", {"algorithm": name, "quantum": q,
+                                                       "workload": wid, "gantt": True})
+        threads = [threading.Thread(target=client, args=(name, q))
+                   for name in core.ALGORITHMS for q in (1, 3)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        for (name, q), res in results.items():
+            gantt, stats = core.run_algorithm(name, self.workload, q)
+            self.assertEqual([tuple(s) for s in res["gantt"]], list(gantt), name)
+            self.assertEqual(as_rows(res), stats, name)
+            self.assertEqual(res["summary"], json.loads(json.dumps(core.aggregate_stats(stats))))
+        again = self.post("/simulate", {"algorithm": "fcfs", "workload": wid})
+        self.assertTrue(again["cached"])
+        self.assertEqual(as_rows(again), core.run_algorithm("fcfs", self.workload)[1])
+
+    def test_batch_inline_and_path(self):
+        procs = [["A", 0, 5, 1], {"pid": "B", "arrival": 1, "burst": 3}]
+        rows = [core._to_process(r, "") for r in procs]
+        out = self.post("/batch", {"requests": [{"algorithm": "mlfq", "quantum": q, "processes": procs}
+                                                for q in (1, 2, 1)]})["results"]
+        for res, q in zip(out, (1, 2, 1)):
+            self.assertEqual(as_rows(res), core.run_algorithm("mlfq", rows, q)[1])
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "w.json")
+            with open(path, "w") as f:
+                json.dump(self.workload, f)
+            res = self.post("/simulate", {"algorithm": "sjf_preemptive", "path": path})
+        self.assertEqual(as_rows(res), core.run_algorithm("sjf_preemptive", self.workload)[1])
+
+    def test_concurrent_inline_registration(self):
+        # every client spools the same new workload while others already run on it
+        procs = core.random_workload(2000, seed=4)
+        want = core.run_algorithm("round_robin", procs, 2)[1]
+        results = []
+        def client():
+            results.append(self.post("/simulate", {"algorithm": "round_robin", "processes": procs}))
+        threads = [threading.Thread(target=client) for _ in range(12)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        self.assertEqual([as_rows(r) for r in results], [want] * 12)
+
+    def test_eviction_while_queued(self):
+        with SimulationService(workers=2, batch_ms=200, max_workloads=1) as service:
+            a = core.random_workload(200, seed=2); b = core.random_workload(200, seed=3)
+            fa, _ = service.register(a)
+            path = service.workload(fa)[0]
+            futures = [service.submit(name, fa) for name in core.ALGORITHMS]
+            service.register(b)                 # evicts a while its runs wait in the batch
+            self.assertTrue(os.path.exists(path))
+            for name, fut in zip(core.ALGORITHMS, futures):
+                self.assertEqual(fut.result(timeout=60)[1], core.run_algorithm(name, a)[1])
+            self.assertFalse(os.path.exists(path))   # removed with its last run
+            with self.assertRaises(KeyError):
+                service.submit("fcfs", fa)
+
+    def test_errors(self):
+        wid = self.post("/workloads", {"processes": self.workload})["workload"]
+        self.assertIn("400", self.error("/simulate", {"algorithm": "nope", "workload": wid}))
+        self.assertIn("400", self.error("/simulate", {"algorithm": "round_robin", "quantum": 0,
+                                                      "workload": wid}))
+        self.assertIn("400", self.error("/simulate", {"processes": [["x"]]}))
+        self.assertIn("400", self.error("/simulate", {"path": "/nonexistent/w.csv"}))
+        self.assertIn("404: unknown workload", self.error("/simulate", {"workload": "zzz"}))
+        self.assertIn("404: no such endpoint", self.error("/nothing", {}))
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "w.json")
+            with open(path, "w") as f:
+                json.dump({"other": []}, f)
+            message = self.error("/workloads", {"path": path})
+        self.assertTrue(message.startswith("400: missing field"), message)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# tests/test_smp.py
+# scheduler_smp: one core reproduces scheduler_core exactly; on several cores
+# every schedule, with either queue mode, is a valid one.
+import os, random, sys, unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scheduler_core as core
+from scheduler_smp import smp_schedule, SMP_ALGORITHMS, QUEUES
+
+TRIALS = 400
+
+def random_processes(rng, zero_bursts=False):
+    n = rng.randint(1, 25)
+    return [[f"P{i}", rng.randint(0, 30), rng.randint(0 if zero_bursts else 1, 12), rng.randint(1, 5)]
+            for i in range(n)]
+
+class SingleCore(unittest.TestCase):
+    def test_matches_scheduler_core(self):
+        for trial in range(TRIALS):
+            rng = random.Random(trial)
+            procs = random_processes(rng, zero_bursts=trial % 5 == 0)
+            q = rng.randint(1, 4)
+            for name in SMP_ALGORITHMS:
+                gantt, stats = core.run_algorithm(name, procs, q)
+                for queues in QUEUES:
+                    lanes, got, info = smp_schedule(name, procs, 1, q, queues)
+                    self.assertEqual(len(lanes), 1)
+                    self.assertEqual(list(lanes[0]), list(gantt), (name, queues, q, procs))
+                    self.assertEqual(got, stats, (name, queues, q, procs))
+
+class MultiCore(unittest.TestCase):
+    def check(self, procs, lanes, stats, where):
+        arrival = {p[0]: p[1] for p in procs}
+        ran, spans = {}, {}
+        for lane in lanes:
+            prev_end = None
+            for pid, s, e in lane:
+                self.assertLess(s, e, where)
+                self.assertGreaterEqual(s, arrival[pid], where)      # never before it arrives
+                if prev_end is not None:
+                    self.assertLessEqual(prev_end, s, where)         # no overlap within a lane
+                prev_end = e
+                ran[pid] = ran.get(pid, 0) + e - s
+                spans.setdefault(pid, []).append((s, e))
+        for pid, segs in spans.items():                             # never on two cores at once
+            segs.sort()
+            for (_, e), (s, _) in zip(segs, segs[1:]):
+                self.assertLessEqual(e, s, (where, pid))
+        for p in procs:
+            if p[2] > 0:
+                self.assertEqual(ran.get(p[0]), p[2], (where, p))   # run time equals burst
+        self.assertEqual(sorted(r[0] for r in stats), sorted(ran), where)
+
+    def test_invariants(self):
+        for trial in range(TRIALS // 2):
+            rng = random.Random(10000 + trial)
+            procs = random_processes(rng)
+            q = rng.randint(1, 4)
+            for name in SMP_ALGORITHMS:
+                for cpus in (2, 3, 5):
+                    for queues in QUEUES:
+                        for steal in (True, False):
+                            lanes, stats, info = smp_schedule(name, procs, cpus, q, queues, steal, seed=trial)
+                            self.assertEqual(len(lanes), cpus)
+                            self.check(procs, lanes, stats, (name, cpus, queues, steal, trial))
+
+if __name__ == "__main__":
+    unittest.main()